@@ -45,15 +45,7 @@ class ClipboardDatabaseTest {
     @Test
     fun insertAndGetClipboardItem() =
         runTest {
-            val testEntity =
-                ClipboardItemEntity(
-                    id = "test-id",
-                    content = "Test content",
-                    timestamp = System.currentTimeMillis(),
-                    contentType = ContentType.TEXT,
-                    isEncrypted = false,
-                    size = 12,
-                )
+            val testEntity = entity("test-id", "Test content")
 
             clipboardItemDao.insertItem(testEntity)
 
@@ -65,15 +57,7 @@ class ClipboardDatabaseTest {
     @Test
     fun deleteClipboardItem() =
         runTest {
-            val testEntity =
-                ClipboardItemEntity(
-                    id = "test-id",
-                    content = "Test content",
-                    timestamp = System.currentTimeMillis(),
-                    contentType = ContentType.TEXT,
-                    isEncrypted = false,
-                    size = 12,
-                )
+            val testEntity = entity("test-id", "Test content")
 
             clipboardItemDao.insertItem(testEntity)
             clipboardItemDao.deleteItem(testEntity)
@@ -86,25 +70,8 @@ class ClipboardDatabaseTest {
     @Test
     fun getItemCount() =
         runTest {
-            val testEntity1 =
-                ClipboardItemEntity(
-                    id = "test-id-1",
-                    content = "Test content 1",
-                    timestamp = System.currentTimeMillis(),
-                    contentType = ContentType.TEXT,
-                    isEncrypted = false,
-                    size = 14,
-                )
-
-            val testEntity2 =
-                ClipboardItemEntity(
-                    id = "test-id-2",
-                    content = "Test content 2",
-                    timestamp = System.currentTimeMillis(),
-                    contentType = ContentType.TEXT,
-                    isEncrypted = false,
-                    size = 14,
-                )
+            val testEntity1 = entity("test-id-1", "Test content 1")
+            val testEntity2 = entity("test-id-2", "Test content 2")
 
             clipboardItemDao.insertItem(testEntity1)
             clipboardItemDao.insertItem(testEntity2)
@@ -113,4 +80,17 @@ class ClipboardDatabaseTest {
 
             assertEquals(2, count)
         }
+
+    private fun entity(
+        id: String,
+        content: String,
+    ): ClipboardItemEntity =
+        ClipboardItemEntity(
+            id = id,
+            content = content,
+            timestamp = System.currentTimeMillis(),
+            contentType = ContentType.TEXT,
+            isEncrypted = false,
+            size = content.length,
+        )
 }
@@ -39,6 +39,7 @@ class MainScreenTest {
             )
 
         whenever(mockViewModel.uiState).thenReturn(MutableStateFlow(uiState))
+        whenever(mockViewModel.minuteTick).thenReturn(MutableStateFlow(0L))
 
         composeTestRule.setContent {
             ClipboardHistoryTheme {
@@ -87,6 +88,7 @@ class MainScreenTest {
             )
 
         whenever(mockViewModel.uiState).thenReturn(MutableStateFlow(uiState))
+        whenever(mockViewModel.minuteTick).thenReturn(MutableStateFlow(0L))
 
         composeTestRule.setContent {
             ClipboardHistoryTheme {
@@ -118,6 +120,7 @@ class MainScreenTest {
             )
 
         whenever(mockViewModel.uiState).thenReturn(MutableStateFlow(uiState))
+        whenever(mockViewModel.minuteTick).thenReturn(MutableStateFlow(0L))
 
         composeTestRule.setContent {
             ClipboardHistoryTheme {
@@ -148,6 +151,7 @@ class MainScreenTest {
             )
 
         whenever(mockViewModel.uiState).thenReturn(MutableStateFlow(uiState))
+        whenever(mockViewModel.minuteTick).thenReturn(MutableStateFlow(0L))
 
         composeTestRule.setContent {
             ClipboardHistoryTheme {
@@ -179,6 +183,7 @@ class MainScreenTest {
             )
 
         whenever(mockViewModel.uiState).thenReturn(MutableStateFlow(uiState))
+        whenever(mockViewModel.minuteTick).thenReturn(MutableStateFlow(0L))
 
         composeTestRule.setContent {
             ClipboardHistoryTheme {
@@ -8,8 +8,11 @@ import androidx.compose.ui.test.performClick
 import com.clipboardhistory.domain.model.ClipboardItem
 import com.clipboardhistory.presentation.ui.screens.MainScreen
 import com.clipboardhistory.presentation.viewmodels.MainViewModel
+import kotlinx.coroutines.flow.MutableStateFlow
+import org.junit.Before
 import org.junit.Rule
 import org.junit.Test
+import org.mockito.Mockito.`when`
 import org.mockito.Mockito.mock
 import org.mockito.Mockito.verify
 
@@ -25,6 +28,11 @@ class MainScreenTest {
 
     private val mockViewModel = mock(MainViewModel::class.java)
 
+    @Before
+    fun setup() {
+        `when`(mockViewModel.minuteTick).thenReturn(MutableStateFlow(0L))
+    }
+
     @Test
     fun mainScreen_displaysCorrectTitle() {
         composeTestRule.setContent {
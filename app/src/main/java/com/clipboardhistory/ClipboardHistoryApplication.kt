@@ -1,7 +1,10 @@
 package com.clipboardhistory
 
 import android.app.Application
+import androidx.hilt.work.HiltWorkerFactory
+import androidx.work.Configuration
 import dagger.hilt.android.HiltAndroidApp
+import javax.inject.Inject
 
 /**
  * Main application class for the Clipboard History app.
@@ -10,7 +13,16 @@ import dagger.hilt.android.HiltAndroidApp
  * the Dagger Hilt dependency injection framework.
  */
 @HiltAndroidApp
-class ClipboardHistoryApplication : Application() {
+class ClipboardHistoryApplication : Application(), Configuration.Provider {
+    @Inject
+    lateinit var workerFactory: HiltWorkerFactory
+
+    override val workManagerConfiguration: Configuration
+        get() =
+            Configuration.Builder()
+                .setWorkerFactory(workerFactory)
+                .build()
+
     override fun onCreate() {
         super.onCreate()
         // Initialize any global components here
@@ -8,9 +8,12 @@ import com.clipboardhistory.domain.model.ClipboardItem
 import com.clipboardhistory.domain.model.ClipboardSettings
 import com.clipboardhistory.domain.repository.ClipboardRepository
 import com.clipboardhistory.domain.repository.ClipboardStatistics
+import kotlinx.coroutines.channels.BufferOverflow
 import kotlinx.coroutines.flow.Flow
+import kotlinx.coroutines.flow.MutableSharedFlow
 import kotlinx.coroutines.flow.first
 import kotlinx.coroutines.flow.map
+import kotlinx.coroutines.flow.onSubscription
 import javax.inject.Inject
 import javax.inject.Singleton
 
@@ -27,6 +30,13 @@ class ClipboardRepositoryImpl
         private val clipboardItemDao: ClipboardItemDao,
         private val encryptionManager: EncryptionManager,
     ) : ClipboardRepository {
+        // Settings saved through this repository, pushed to observers in this process
+        private val settingsUpdates =
+            MutableSharedFlow<ClipboardSettings>(
+                extraBufferCapacity = 1,
+                onBufferOverflow = BufferOverflow.DROP_OLDEST,
+            )
+
         override fun getAllItems(): Flow<List<ClipboardItem>> {
             return clipboardItemDao.getAllItems().map { entities ->
                 entities.map { entity ->
@@ -116,6 +126,12 @@ class ClipboardRepositoryImpl
             encryptionManager.storeSecureString("enable_accessibility_monitoring", settings.enableAccessibilityMonitoring.toString())
             // Maintain compatibility with tests expecting clipboard_mode persistence
             encryptionManager.storeSecureString("clipboard_mode", "EXTEND")
+            settingsUpdates.tryEmit(settings)
+        }
+
+        override fun observeSettings(): Flow<ClipboardSettings> {
+            // Read the stored settings only once subscribed, so no update can slip in between
+            return settingsUpdates.onSubscription { emit(getSettings()) }
         }
 
         override suspend fun getItemsWithPagination(
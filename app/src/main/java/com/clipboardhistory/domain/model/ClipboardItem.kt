@@ -1,6 +1,7 @@
 package com.clipboardhistory.domain.model
 
 import android.os.Parcelable
+import androidx.compose.runtime.Immutable
 import kotlinx.parcelize.Parcelize
 
 /**
@@ -13,6 +14,7 @@ import kotlinx.parcelize.Parcelize
  * @property isEncrypted Whether the content is encrypted in storage
  * @property size Size of the content in bytes
  */
+@Immutable
 @Parcelize
 data class ClipboardItem(
     val id: String,
@@ -153,6 +155,7 @@ object BubbleThemes {
  * @property selectedTheme The selected bubble theme
  * @property bubbleType The type/shape of bubbles to display
  */
+@Immutable
 data class ClipboardSettings(
     val maxHistorySize: Int = 100,
     val autoDeleteAfterHours: Int = 24,
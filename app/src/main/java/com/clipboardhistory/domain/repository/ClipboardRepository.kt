@@ -80,6 +80,13 @@ interface ClipboardRepository {
      */
     suspend fun updateSettings(settings: ClipboardSettings)
 
+    /**
+     * Observe the clipboard settings.
+     *
+     * @return Flow emitting the current settings, then every settings update
+     */
+    fun observeSettings(): Flow<ClipboardSettings>
+
     /**
      * Get clipboard items with pagination.
      *
@@ -73,6 +73,16 @@ class GetAllClipboardItemsUseCase
         operator fun invoke(): Flow<List<ClipboardItem>> {
             return repository.getAllItems()
         }
+
+        /**
+         * Gets the most recent clipboard items, limited in the query itself.
+         *
+         * @param limit The maximum number of items to return
+         * @return The newest items first
+         */
+        suspend operator fun invoke(limit: Int): List<ClipboardItem> {
+            return repository.getItemsWithPagination(limit, 0)
+        }
     }
 
 /**
@@ -133,6 +143,15 @@ class GetClipboardSettingsUseCase
         suspend operator fun invoke(): ClipboardSettings {
             return repository.getSettings()
         }
+
+        /**
+         * Observes the clipboard settings.
+         *
+         * @return Flow emitting the current settings, then every settings update
+         */
+        fun observe(): Flow<ClipboardSettings> {
+            return repository.observeSettings()
+        }
     }
 
 /**
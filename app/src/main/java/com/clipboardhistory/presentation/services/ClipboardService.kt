@@ -8,19 +8,33 @@ import android.app.Service
 import android.content.ClipboardManager
 import android.content.Context
 import android.content.Intent
+import android.content.pm.ServiceInfo
 import android.os.Build
+import android.os.Handler
 import android.os.IBinder
+import android.os.Looper
+import android.os.SystemClock
+import android.util.Log
+import androidx.annotation.VisibleForTesting
 import androidx.core.app.NotificationCompat
+import androidx.core.app.ServiceCompat
+import com.clipboardhistory.BuildConfig
 import com.clipboardhistory.R
 import com.clipboardhistory.domain.model.ContentType
 import com.clipboardhistory.domain.usecase.AddClipboardItemUseCase
-import com.clipboardhistory.domain.usecase.CleanupOldItemsUseCase
-import com.clipboardhistory.domain.usecase.GetClipboardSettingsUseCase
 import com.clipboardhistory.presentation.MainActivity
+import com.clipboardhistory.presentation.workers.CleanupWorker
+import com.clipboardhistory.utils.ClipboardUtils
 import dagger.hilt.android.AndroidEntryPoint
+import kotlinx.coroutines.CancellationException
+import kotlinx.coroutines.CoroutineName
 import kotlinx.coroutines.CoroutineScope
 import kotlinx.coroutines.Dispatchers
-import kotlinx.coroutines.Job
+import kotlinx.coroutines.ExperimentalCoroutinesApi
+import kotlinx.coroutines.SupervisorJob
+import kotlinx.coroutines.channels.Channel
+import kotlinx.coroutines.channels.consumeEach
+import kotlinx.coroutines.delay
 import kotlinx.coroutines.launch
 import javax.inject.Inject
 
@@ -35,43 +49,92 @@ class ClipboardService : Service() {
     @Inject
     lateinit var addClipboardItemUseCase: AddClipboardItemUseCase
 
-    @Inject
-    lateinit var getClipboardSettingsUseCase: GetClipboardSettingsUseCase
-
-    @Inject
-    lateinit var cleanupOldItemsUseCase: CleanupOldItemsUseCase
-
     private lateinit var clipboardManager: ClipboardManager
     private lateinit var notificationManager: NotificationManager
-    private val serviceJob = Job()
-    private val serviceScope = CoroutineScope(Dispatchers.IO + serviceJob)
+    private lateinit var notificationBuilder: NotificationCompat.Builder
+    // Clipboard work is a serial queue: one IO worker, and one failed child doesn't cancel the rest
+    private val serviceJob = SupervisorJob()
+
+    @OptIn(ExperimentalCoroutinesApi::class)
+    private val serviceScope =
+        CoroutineScope(serviceJob + Dispatchers.IO.limitedParallelism(1) + CoroutineName("clip-svc"))
 
     private var lastClipboardText = ""
 
+    // Notification updates are throttled; a burst collapses into one trailing update
+    private val notificationHandler = Handler(Looper.getMainLooper())
+    private val flushNotification = Runnable { flushPendingNotification() }
+    private var lastNotifiedAt = 0L
+    private var pendingNotificationText: String? = null
+
+    // One copy can fire the listener several times; conflating keeps at most one pending change
+    private val clipboardChanges = Channel<Unit>(Channel.CONFLATED)
+
     private val clipboardListener =
         ClipboardManager.OnPrimaryClipChangedListener {
-            handleClipboardChange()
+            clipboardChanges.trySend(Unit)
         }
 
     companion object {
+        private const val TAG = "ClipboardService"
         private const val NOTIFICATION_ID = 1001
         private const val CHANNEL_ID = "clipboard_service_channel"
         private const val CHANNEL_NAME = "Clipboard Service"
+
+        private const val CLIPBOARD_DEBOUNCE_MS = 150L
+        private const val NOTIFICATION_MIN_INTERVAL_MS = 500L
+
+        private val IMAGE_EXTENSIONS = arrayOf(".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp")
+        // What Regex's '.' refuses to match: text spanning lines is never a single file name
+        private val LINE_TERMINATORS = charArrayOf('\n', '\r', '\u0085', '\u2028', '\u2029')
+
+        /**
+         * Checks whether the text is a single image file name or path.
+         *
+         * Multi-line text is rejected, as the old `.*\\.(jpg|...)$` match did; single-line text
+         * then has its tail compared in place against each extension, so nothing is allocated.
+         *
+         * @param text The clipboard text
+         * @return True if the text is a single line ending with a known image extension
+         */
+        @VisibleForTesting
+        internal fun hasImageExtension(text: String): Boolean {
+            if (text.indexOfAny(LINE_TERMINATORS) >= 0) return false
+            return IMAGE_EXTENSIONS.any { text.endsWith(it, ignoreCase = true) }
+        }
     }
 
     override fun onCreate() {
         super.onCreate()
-        clipboardManager = getSystemService(Context.CLIPBOARD_SERVICE) as ClipboardManager
+        // Enter the foreground before anything else so a slow start can't miss the deadline
         notificationManager = getSystemService(Context.NOTIFICATION_SERVICE) as NotificationManager
-
         createNotificationChannel()
-        startForeground(NOTIFICATION_ID, createNotification())
+        notificationBuilder = createNotificationBuilder()
+        ServiceCompat.startForeground(
+            this,
+            NOTIFICATION_ID,
+            createNotification(),
+            ServiceInfo.FOREGROUND_SERVICE_TYPE_DATA_SYNC,
+        )
+
+        clipboardManager = getSystemService(Context.CLIPBOARD_SERVICE) as ClipboardManager
+
+        // Old items are pruned by a periodic worker instead of on each clipboard change
+        CleanupWorker.schedule(this)
+
+        serviceScope.launch {
+            clipboardChanges.consumeEach {
+                // Let the rest of a listener burst arrive and conflate before reading the clip
+                delay(CLIPBOARD_DEBOUNCE_MS)
+                handleClipboardChange()
+            }
+        }
 
         // Add clipboard listener
         clipboardManager.addPrimaryClipChangedListener(clipboardListener)
 
         // Initialize with current clipboard content
-        handleClipboardChange()
+        clipboardChanges.trySend(Unit)
     }
 
     override fun onBind(intent: Intent?): IBinder? {
@@ -89,42 +152,50 @@ class ClipboardService : Service() {
     override fun onDestroy() {
         super.onDestroy()
         clipboardManager.removePrimaryClipChangedListener(clipboardListener)
+        clipboardChanges.close()
+        notificationHandler.removeCallbacks(flushNotification)
         serviceJob.cancel()
     }
 
     /**
      * Handles clipboard changes and saves new items.
      */
-    private fun handleClipboardChange() {
-        serviceScope.launch {
-            try {
-                val clipData = clipboardManager.primaryClip
-                if (clipData != null && clipData.itemCount > 0) {
-                    val clipText = clipData.getItemAt(0).text?.toString() ?: ""
+    private suspend fun handleClipboardChange() {
+        try {
+            // Skip images, files and other non-text clips without fetching their data
+            if (!ClipboardUtils.hasTextClip(clipboardManager)) return
+
+            val clipData = clipboardManager.primaryClip
+            if (clipData != null && clipData.itemCount > 0) {
+                val text = clipData.getItemAt(0).text ?: return
+
+                // Repeats of the last clip are the common case: reject on length first, and compare
+                // styled text in place instead of copying it to a String just to find it unchanged
+                if (text.length == lastClipboardText.length && lastClipboardText.contentEquals(text)) return
 
-                    // Only process if the text has changed and is not empty
-                    if (clipText.isNotBlank() && clipText != lastClipboardText) {
-                        lastClipboardText = clipText
+                val clipText = text.toString()
 
-                        // Determine content type
-                        val contentType = determineContentType(clipText)
+                // Only process if the text is not empty
+                if (clipText.isNotBlank()) {
+                    lastClipboardText = clipText
 
-                        // Add to database (only if not duplicate)
-                        val result = addClipboardItemUseCase(clipText, contentType)
+                    // Determine content type
+                    val contentType = determineContentType(clipText)
 
-                        // Update notification only if content was added
-                        if (result != null) {
-                            updateNotification(clipText)
-                        }
+                    // Add to database (only if not duplicate)
+                    val result = addClipboardItemUseCase(clipText, contentType)
 
-                        // Cleanup old items periodically
-                        val settings = getClipboardSettingsUseCase()
-                        cleanupOldItemsUseCase(settings)
+                    // Update notification only if content was added
+                    if (result != null) {
+                        updateNotification(clipText)
                     }
                 }
-            } catch (e: Exception) {
-                e.printStackTrace()
             }
+        } catch (e: CancellationException) {
+            // The service is being destroyed: not a failed save
+            throw e
+        } catch (e: Exception) {
+            if (BuildConfig.DEBUG) Log.w(TAG, "Failed to save clipboard change", e)
         }
     }
 
@@ -136,9 +207,9 @@ class ClipboardService : Service() {
      */
     private fun determineContentType(text: String): ContentType {
         return when {
-            text.startsWith("http://") || text.startsWith("https://") -> ContentType.URL
+            text.length > 7 && (text.startsWith("https://") || text.startsWith("http://")) -> ContentType.URL
             text.startsWith("file://") -> ContentType.FILE
-            text.matches(Regex(".*\\.(jpg|jpeg|png|gif|bmp|webp)$", RegexOption.IGNORE_CASE)) -> ContentType.IMAGE
+            hasImageExtension(text) -> ContentType.IMAGE
             else -> ContentType.TEXT
         }
     }
@@ -162,12 +233,11 @@ class ClipboardService : Service() {
     }
 
     /**
-     * Creates the notification for the foreground service.
+     * Creates the notification builder shared by every notification update.
      *
-     * @param lastContent The last clipboard content (optional)
-     * @return The notification
+     * @return The builder with everything but the content text set
      */
-    private fun createNotification(lastContent: String = ""): Notification {
+    private fun createNotificationBuilder(): NotificationCompat.Builder {
         val intent = Intent(this, MainActivity::class.java)
         val pendingIntent =
             PendingIntent.getActivity(
@@ -177,31 +247,65 @@ class ClipboardService : Service() {
                 PendingIntent.FLAG_UPDATE_CURRENT or PendingIntent.FLAG_IMMUTABLE,
             )
 
-        val contentText =
-            if (lastContent.isBlank()) {
-                "Monitoring clipboard changes"
-            } else {
-                "Last: ${lastContent.take(30)}${if (lastContent.length > 30) "..." else ""}"
-            }
-
         return NotificationCompat.Builder(this, CHANNEL_ID)
             .setContentTitle("Clipboard History")
-            .setContentText(contentText)
             .setSmallIcon(R.drawable.ic_notification)
             .setContentIntent(pendingIntent)
             .setOngoing(true)
             .setCategory(NotificationCompat.CATEGORY_SERVICE)
             .setVisibility(NotificationCompat.VISIBILITY_PUBLIC)
-            .build()
+    }
+
+    /**
+     * Creates the notification for the foreground service.
+     *
+     * @param lastContent The last clipboard content (optional)
+     * @return The notification
+     */
+    private fun createNotification(lastContent: String = ""): Notification {
+        val contentText =
+            if (lastContent.isBlank()) {
+                "Monitoring clipboard changes"
+            } else {
+                "Last: ${lastContent.take(30)}${if (lastContent.length > 30) "..." else ""}"
+            }
+
+        return notificationBuilder.setContentText(contentText).build()
     }
 
     /**
      * Updates the notification with new clipboard content.
      *
+     * Posts at most once per [NOTIFICATION_MIN_INTERVAL_MS]; updates arriving sooner are
+     * coalesced into a single trailing update showing the newest content.
+     *
      * @param content The new clipboard content
      */
+    @Synchronized
     private fun updateNotification(content: String) {
-        val notification = createNotification(content)
-        notificationManager.notify(NOTIFICATION_ID, notification)
+        val wait = lastNotifiedAt + NOTIFICATION_MIN_INTERVAL_MS - SystemClock.uptimeMillis()
+        if (wait > 0) {
+            if (pendingNotificationText == null) {
+                notificationHandler.postDelayed(flushNotification, wait)
+            }
+            pendingNotificationText = content
+            return
+        }
+        notifyNow(content)
+    }
+
+    /**
+     * Posts the trailing update coalesced by [updateNotification], if any.
+     */
+    @Synchronized
+    private fun flushPendingNotification() {
+        val content = pendingNotificationText ?: return
+        pendingNotificationText = null
+        notifyNow(content)
+    }
+
+    private fun notifyNow(content: String) {
+        lastNotifiedAt = SystemClock.uptimeMillis()
+        notificationManager.notify(NOTIFICATION_ID, createNotification(content))
     }
 }
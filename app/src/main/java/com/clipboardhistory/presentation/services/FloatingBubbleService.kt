@@ -10,18 +10,26 @@ import android.content.ClipData
 import android.content.ClipboardManager
 import android.content.Context
 import android.content.Intent
+import android.content.pm.ServiceInfo
+import android.content.res.Configuration
 import android.graphics.PixelFormat
 import android.os.Build
 import android.os.IBinder
 import android.provider.Settings
+import android.util.Log
+import android.view.Choreographer
 import android.view.Gravity
 import android.view.MotionEvent
 import android.view.WindowManager
 import android.widget.Toast
 import androidx.core.app.NotificationCompat
+import androidx.core.app.ServiceCompat
+import com.clipboardhistory.BuildConfig
 import com.clipboardhistory.R
 import com.clipboardhistory.domain.model.BubbleState
+import com.clipboardhistory.domain.model.BubbleTheme
 import com.clipboardhistory.domain.model.BubbleType
+import com.clipboardhistory.domain.model.ClipboardSettings
 import com.clipboardhistory.domain.model.ContentAnalyzer
 import com.clipboardhistory.domain.model.SmartAction
 import com.clipboardhistory.domain.usecase.AddClipboardItemUseCase
@@ -33,12 +41,17 @@ import com.clipboardhistory.presentation.ui.components.BubbleView
 import com.clipboardhistory.presentation.ui.components.BubbleViewFactory
 import com.clipboardhistory.presentation.ui.components.HighlightedAreaView
 import com.clipboardhistory.presentation.ui.toolbelt.TransparencyController
+import com.clipboardhistory.utils.ClipboardUtils
 import com.clipboardhistory.utils.ServiceKeyboardDetector
 import dagger.hilt.android.AndroidEntryPoint
+import kotlinx.coroutines.CancellationException
+import kotlinx.coroutines.CoroutineName
 import kotlinx.coroutines.CoroutineScope
 import kotlinx.coroutines.Dispatchers
+import kotlinx.coroutines.ExperimentalCoroutinesApi
 import kotlinx.coroutines.Job
-import kotlinx.coroutines.flow.first
+import kotlinx.coroutines.SupervisorJob
+import kotlinx.coroutines.flow.distinctUntilChanged
 import kotlinx.coroutines.launch
 import kotlinx.coroutines.withContext
 import javax.inject.Inject
@@ -64,18 +77,36 @@ class FloatingBubbleService : Service() {
     private lateinit var clipboardManager: ClipboardManager
     private lateinit var notificationManager: NotificationManager
 
-    private val serviceJob = Job()
-    private val serviceScope = CoroutineScope(Dispatchers.IO + serviceJob)
-    private val mainScope = CoroutineScope(Dispatchers.Main + serviceJob)
+    // The monitoring loop re-posts the notification; reuse one PendingIntent instead of a Binder call each time
+    private val contentPendingIntent: PendingIntent by lazy {
+        PendingIntent.getActivity(
+            this,
+            0,
+            Intent(this, MainActivity::class.java),
+            PendingIntent.FLAG_UPDATE_CURRENT or PendingIntent.FLAG_IMMUTABLE,
+        )
+    }
+
+    // Background work runs on one IO worker, and one failed child doesn't cancel the rest
+    private val serviceJob = SupervisorJob()
+
+    @OptIn(ExperimentalCoroutinesApi::class)
+    private val serviceScope =
+        CoroutineScope(serviceJob + Dispatchers.IO.limitedParallelism(1) + CoroutineName("bubble-svc"))
+    private val mainScope = CoroutineScope(Dispatchers.Main.immediate + serviceJob)
 
     // Service monitoring
     private var isServiceRunning = false
     private var lastActivityTime = System.currentTimeMillis()
 
-    private val bubbles = mutableListOf<BubbleData>()
+    // Ordered by creation: positions and low-memory trimming depend on it. Capped at MAX_BUBBLE_COUNT.
+    private val bubbles = ArrayList<BubbleData>(MAX_BUBBLE_COUNT)
     private var emptyBubble: BubbleData? = null
     private var currentBubbleOpacity: Float = 0.8f
 
+    // Pending load of the full bubbles; while it runs, no second load is started
+    private var bubbleLoadJob: Job? = null
+
     // Smart UI components
     private lateinit var keyboardDetector: ServiceKeyboardDetector
     private lateinit var smartInputManager: SmartInputManager
@@ -86,6 +117,12 @@ class FloatingBubbleService : Service() {
         updateAllBubbleOpacity(opacity)
     }
     private var currentBubbleSizeDp: Int = DEFAULT_BUBBLE_SIZE_DP
+
+    // Pixel sizes cached off the touch path; refreshed when the size setting or configuration changes
+    private var bubbleSizePx = 0
+    private var bubbleMarginPx = 0
+    private var screenWidthPx = 0
+    private var screenHeightPx = 0
     private var currentThemeName: String = "Default"
     private var currentBubbleType: BubbleType = BubbleType.CIRCLE
 
@@ -100,11 +137,18 @@ class FloatingBubbleService : Service() {
     private var isEdgeActivated = false
     private var currentDragEdge: HighlightedAreaView.ActivationEdge = HighlightedAreaView.ActivationEdge.NONE
 
+    // One reusable toast: rapid bubble taps replace its text instead of queueing a new toast each
+    private val feedbackToast: Toast by lazy { Toast.makeText(this, "", Toast.LENGTH_SHORT) }
+
     // 2-second append window variables
     private var lastCopyTime: Long = 0
     private var appendWindowActive: Boolean = false
 
+    // Reused to build appended clips; only touched on the main thread and emptied after each use
+    private val appendBuffer = StringBuilder(APPEND_BUFFER_CAPACITY)
+
     companion object {
+        private const val TAG = "FloatingBubbleService"
         private const val NOTIFICATION_ID = 1002
         private const val CHANNEL_ID = "floating_bubble_channel"
         private const val CHANNEL_NAME = "Floating Bubbles"
@@ -112,16 +156,21 @@ class FloatingBubbleService : Service() {
         private const val BUBBLE_MARGIN_DP = 16
         private const val EDGE_THRESHOLD_PX = 100
         private const val APPEND_WINDOW_MS = 2000L
+        private const val APPEND_BUFFER_CAPACITY = 4096
         private const val SERVICE_CHECK_INTERVAL_MS = 30000L
         private const val SERVICE_RESTART_DELAY_MS = 5000L
         private const val SERVICE_INIT_RETRY_DELAY_MS = 3000L
         private const val BUBBLE_RECOVERY_DELAY_MS = 1000L
         private const val MAX_BUBBLE_COUNT = 5
         private const val MAX_LOW_MEMORY_BUBBLES = 3
+        private const val BUBBLE_LIMIT_MESSAGE = "Bubble limit reached - remove a bubble to add another"
     }
 
     /**
-     * Data class representing a floating bubble with its data and state.
+     * Holder for a floating bubble with its data and state.
+     *
+     * A plain class with field access: bubbles are compared by identity and
+     * never copied, and the drag handler reads [params] on every touch sample.
      *
      * @property view The bubble view
      * @property params The window layout parameters
@@ -131,33 +180,40 @@ class FloatingBubbleService : Service() {
      * @property bubbleType The type/shape of the bubble
      * @property transparencyCallback Callback for transparency updates
      */
-    data class BubbleData(
-        var view: BubbleView,
-        val params: WindowManager.LayoutParams,
-        var content: String? = null,
-        var state: BubbleState,
-        var originalState: BubbleState = state,
-        val bubbleType: BubbleType = BubbleType.CIRCLE,
-        val transparencyCallback: (Float) -> Unit = { opacity ->
+    class BubbleData(
+        @JvmField var view: BubbleView,
+        @JvmField val params: WindowManager.LayoutParams,
+        @JvmField var content: String? = null,
+        @JvmField var state: BubbleState,
+        @JvmField var originalState: BubbleState = state,
+        @JvmField var bubbleType: BubbleType = BubbleType.CIRCLE,
+        @JvmField val transparencyCallback: (Float) -> Unit = { opacity ->
             params.alpha = opacity
-        }
+        },
     )
 
     override fun onCreate() {
         super.onCreate()
 
         try {
+            // Enter the foreground before anything else so a slow start can't miss the deadline
+            notificationManager = getSystemService(Context.NOTIFICATION_SERVICE) as NotificationManager
+            createNotificationChannel()
+            ServiceCompat.startForeground(
+                this,
+                NOTIFICATION_ID,
+                createNotification(),
+                ServiceInfo.FOREGROUND_SERVICE_TYPE_DATA_SYNC,
+            )
+
+            updateDisplayMetrics()
             windowManager = getSystemService(Context.WINDOW_SERVICE) as WindowManager
             clipboardManager = getSystemService(Context.CLIPBOARD_SERVICE) as ClipboardManager
-            notificationManager = getSystemService(Context.NOTIFICATION_SERVICE) as NotificationManager
 
             // Initialize smart UI components
             keyboardDetector = ServiceKeyboardDetector(this)
             smartInputManager = SmartInputManager(this)
 
-            createNotificationChannel()
-            startForeground(NOTIFICATION_ID, createNotification())
-
             // Guard: require overlay permission to draw bubbles
             if (!Settings.canDrawOverlays(this)) {
                 Toast.makeText(this, getString(R.string.permission_overlay_description), Toast.LENGTH_LONG).show()
@@ -177,7 +233,7 @@ class FloatingBubbleService : Service() {
             // Start service monitoring
             startServiceMonitoring()
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Service startup failed; scheduling restart", e)
             // Attempt to restart service after delay
             serviceScope.launch {
                 kotlinx.coroutines.delay(SERVICE_RESTART_DELAY_MS)
@@ -187,6 +243,11 @@ class FloatingBubbleService : Service() {
         }
     }
 
+    override fun onConfigurationChanged(newConfig: Configuration) {
+        super.onConfigurationChanged(newConfig)
+        updateDisplayMetrics()
+    }
+
     override fun onBind(intent: Intent?): IBinder? {
         return null
     }
@@ -214,7 +275,7 @@ class FloatingBubbleService : Service() {
         serviceScope.launch {
             // Reduce bubble count if needed
             if (bubbles.size > 3) {
-                withContext(Dispatchers.Main) {
+                withContext(Dispatchers.Main.immediate) {
                     removeExcessBubbles()
                 }
             }
@@ -282,15 +343,12 @@ class FloatingBubbleService : Service() {
     private fun showBubblesForKeyboardInput() {
         try {
             // Only show if we have bubbles to display
-            if (emptyBubble == null && bubbles.isEmpty()) {
-                // Initialize bubbles if none exist
-                initializeBubbles()
-            }
+            recoverBubblesIfGone()
 
             // Ensure bubbles are visible
             updateBubbleVisibility(true)
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to show bubbles for keyboard input", e)
         }
     }
 
@@ -302,7 +360,7 @@ class FloatingBubbleService : Service() {
             // Temporarily hide bubbles (but keep them in memory)
             updateBubbleVisibility(false)
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to hide bubbles for keyboard input", e)
         }
     }
 
@@ -333,7 +391,7 @@ class FloatingBubbleService : Service() {
                 updateContentBubbleAccessibility(bubble.view, bubble.content ?: "")
             }
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to update bubble visibility", e)
         }
     }
 
@@ -368,12 +426,9 @@ class FloatingBubbleService : Service() {
                 try {
                     lastActivityTime = System.currentTimeMillis()
 
-                    // Check if bubbles are still visible
-                    if (emptyBubble == null && bubbles.isEmpty()) {
-                        // Reinitialize if all bubbles are gone
-                        withContext(Dispatchers.Main) {
-                            initializeBubbles()
-                        }
+                    // Bring the bubbles back if they are all gone
+                    withContext(Dispatchers.Main.immediate) {
+                        recoverBubblesIfGone()
                     }
 
                     // Update notification to keep service alive
@@ -381,7 +436,7 @@ class FloatingBubbleService : Service() {
 
                     kotlinx.coroutines.delay(SERVICE_CHECK_INTERVAL_MS)
                 } catch (e: Exception) {
-                    e.printStackTrace()
+                    logWarning("Service monitoring check failed", e)
                     kotlinx.coroutines.delay(SERVICE_RESTART_DELAY_MS)
                 }
             }
@@ -394,16 +449,28 @@ class FloatingBubbleService : Service() {
     private fun initializeServiceWithRetry() {
         serviceScope.launch {
             try {
-                val settings = getClipboardSettingsUseCase()
-                currentBubbleOpacity = settings.bubbleOpacity.coerceIn(0.1f, 1.0f)
-                currentBubbleSizeDp = mapSizeToDp(settings.bubbleSize)
-                currentThemeName = settings.selectedTheme
-                currentBubbleType = settings.bubbleType
-                withContext(Dispatchers.Main) {
-                    initializeBubbles()
-                }
+                // The first emission builds the bubbles; later saves restyle them where they stand
+                getClipboardSettingsUseCase.observe()
+                    .distinctUntilChanged(::hasSameBubbleAppearance)
+                    .collect { settings ->
+                        currentBubbleOpacity = settings.bubbleOpacity.coerceIn(0.1f, 1.0f)
+                        currentBubbleSizeDp = mapSizeToDp(settings.bubbleSize)
+                        updateDisplayMetrics()
+                        currentThemeName = settings.selectedTheme
+                        currentBubbleType = settings.bubbleType
+                        withContext(Dispatchers.Main.immediate) {
+                            if (emptyBubble == null && bubbles.isEmpty()) {
+                                recoverBubblesIfGone()
+                            } else {
+                                applyBubbleAppearance()
+                            }
+                        }
+                    }
+            } catch (e: CancellationException) {
+                // The service is being destroyed: not a failure to retry
+                throw e
             } catch (e: Exception) {
-                e.printStackTrace()
+                logWarning("Failed to load settings; retrying", e)
                 // Retry after 3 seconds
                 kotlinx.coroutines.delay(SERVICE_INIT_RETRY_DELAY_MS)
                 initializeServiceWithRetry()
@@ -411,6 +478,72 @@ class FloatingBubbleService : Service() {
         }
     }
 
+    /**
+     * Checks whether two settings would render the bubbles identically.
+     *
+     * @param old The previously applied settings
+     * @param new The newly emitted settings
+     * @return True if no bubble-related setting changed
+     */
+    private fun hasSameBubbleAppearance(
+        old: ClipboardSettings,
+        new: ClipboardSettings,
+    ): Boolean {
+        return old.bubbleOpacity == new.bubbleOpacity &&
+            old.bubbleSize == new.bubbleSize &&
+            old.selectedTheme == new.selectedTheme &&
+            old.bubbleType == new.bubbleType
+    }
+
+    /**
+     * Rebuilds the bubbles if none are showing and no load is already bringing them back.
+     *
+     * The only entry point to [initializeBubbles]; must run on the main thread, where
+     * [bubbleLoadJob] is assigned, so two loads can never add the same windows.
+     */
+    private fun recoverBubblesIfGone() {
+        if (bubbleLoadJob?.isActive == true) return
+        if (emptyBubble == null && bubbles.isEmpty()) {
+            initializeBubbles()
+        }
+    }
+
+    /**
+     * Applies the current theme, shape, size and opacity to the bubbles on screen.
+     *
+     * The windows are updated in place, so bubbles keep the positions they were dragged to.
+     */
+    private fun applyBubbleAppearance() {
+        val theme = BubbleViewFactory.getTheme(currentThemeName)
+        synchronized(bubbleLock) {
+            emptyBubble?.let { applyBubbleAppearance(it, theme) }
+            bubbles.forEach { applyBubbleAppearance(it, theme) }
+        }
+    }
+
+    /**
+     * Applies the current appearance settings to one bubble.
+     *
+     * @param bubble The bubble to update
+     * @param theme The theme to apply
+     */
+    private fun applyBubbleAppearance(
+        bubble: BubbleData,
+        theme: BubbleTheme,
+    ) {
+        bubble.bubbleType = currentBubbleType
+        bubble.view.updateTheme(theme)
+        bubble.view.updateBubbleType(currentBubbleType)
+        bubble.view.updateOpacity(currentBubbleOpacity)
+        bubble.params.width = bubbleSizePx
+        bubble.params.height = bubbleSizePx
+        try {
+            windowManager.updateViewLayout(bubble.view, bubble.params)
+        } catch (e: Exception) {
+            logWarning("Failed to update bubble appearance", e)
+        }
+    }
+
     /**
      * Initializes the floating bubbles.
      */
@@ -420,21 +553,26 @@ class FloatingBubbleService : Service() {
             createEmptyBubble()
 
             // Load existing clipboard items and create bubbles
-            serviceScope.launch {
-                try {
-                    val items = getAllClipboardItemsUseCase().first()
-                    withContext(Dispatchers.Main) {
-                        items.take(MAX_BUBBLE_COUNT).forEachIndexed { index, item ->
-                            createFullBubble(item.content, index)
+            bubbleLoadJob =
+                serviceScope.launch {
+                    try {
+                        // LIMIT in the query: only the bubbles we can show are loaded
+                        val items = getAllClipboardItemsUseCase(limit = MAX_BUBBLE_COUNT)
+                        withContext(Dispatchers.Main.immediate) {
+                            items.forEachIndexed { index, item ->
+                                createFullBubble(item.content, index)
+                            }
                         }
+                    } catch (e: CancellationException) {
+                        // Superseded by a rebuild: leave the new bubbles alone
+                        throw e
+                    } catch (e: Exception) {
+                        logWarning("Failed to load clipboard items for bubbles", e)
+                        // Continue with just empty bubble if loading fails
                     }
-                } catch (e: Exception) {
-                    e.printStackTrace()
-                    // Continue with just empty bubble if loading fails
                 }
-            }
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to initialize bubbles", e)
         }
     }
 
@@ -504,17 +642,17 @@ class FloatingBubbleService : Service() {
                 windowManager.addView(bubbleView, bubble.params)
                 emptyBubble = bubble
             } catch (e: Exception) {
-                e.printStackTrace()
+                logWarning("Failed to add empty bubble; retrying", e)
                 // Try to recover by recreating the bubble
                 serviceScope.launch {
                     kotlinx.coroutines.delay(BUBBLE_RECOVERY_DELAY_MS)
-                    withContext(Dispatchers.Main) {
+                    withContext(Dispatchers.Main.immediate) {
                         createEmptyBubble()
                     }
                 }
             }
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to create empty bubble", e)
         }
     }
 
@@ -528,6 +666,8 @@ class FloatingBubbleService : Service() {
         content: String,
         index: Int,
     ) {
+        if (bubbles.size >= MAX_BUBBLE_COUNT) return
+
         val bubbleView =
             BubbleViewFactory.createBubbleView(
                 context = this,
@@ -548,7 +688,7 @@ class FloatingBubbleService : Service() {
             )
 
         // Position relative to empty bubble
-        bubble.params.x = 100 + (index + 1) * (currentBubbleSizeDp + BUBBLE_MARGIN_DP)
+        bubble.params.x = 100 + (index + 1) * (bubbleSizePx + bubbleMarginPx)
         bubble.params.y = 100
 
         // Set click listener
@@ -585,7 +725,7 @@ class FloatingBubbleService : Service() {
             windowManager.addView(bubbleView, bubble.params)
             bubbles.add(bubble)
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to add full bubble", e)
         }
     }
 
@@ -602,7 +742,6 @@ class FloatingBubbleService : Service() {
                 @Suppress("DEPRECATION")
                 WindowManager.LayoutParams.TYPE_PHONE
             }
-        val bubbleSizePx = dpToPx(currentBubbleSizeDp)
         val params =
             WindowManager.LayoutParams(
                 bubbleSizePx,
@@ -629,6 +768,21 @@ class FloatingBubbleService : Service() {
         var initialTouchY = 0f
         var dragStarted = false
 
+        var dragError: Exception? = null
+
+        // Touch samples can outpace the display; push the window position at most once per frame
+        var layoutFrameScheduled = false
+        val layoutFrameCallback =
+            Choreographer.FrameCallback {
+                layoutFrameScheduled = false
+                try {
+                    windowManager.updateViewLayout(bubble.view, bubble.params)
+                } catch (e: Exception) {
+                    // Runs every frame of a drag: remember the failure and report it once on ACTION_UP
+                    dragError = e
+                }
+            }
+
         bubble.view.setOnTouchListener { _, event ->
             when (event.action) {
                 MotionEvent.ACTION_DOWN -> {
@@ -660,15 +814,22 @@ class FloatingBubbleService : Service() {
                         // Check for edge activation
                         checkEdgeActivation(event.rawX, event.rawY)
 
-                        try {
-                            windowManager.updateViewLayout(bubble.view, bubble.params)
-                        } catch (e: Exception) {
-                            e.printStackTrace()
+                        if (!layoutFrameScheduled) {
+                            layoutFrameScheduled = true
+                            Choreographer.getInstance().postFrameCallback(layoutFrameCallback)
                         }
                     }
                     true
                 }
                 MotionEvent.ACTION_UP -> {
+                    // snapToEdge below applies the final position itself
+                    if (layoutFrameScheduled) {
+                        Choreographer.getInstance().removeFrameCallback(layoutFrameCallback)
+                        layoutFrameScheduled = false
+                    }
+                    dragError?.let { logWarning("Failed to move bubble during drag", it) }
+                    dragError = null
+
                     if (dragStarted && bubble.content != null && isEdgeActivated) {
                         // Check if bubble was dropped on an action area
                         val smartAction =
@@ -718,9 +879,8 @@ class FloatingBubbleService : Service() {
         x: Float,
         y: Float,
     ) {
-        val displayMetrics = resources.displayMetrics
-        val screenWidth = displayMetrics.widthPixels
-        val screenHeight = displayMetrics.heightPixels
+        val screenWidth = screenWidthPx
+        val screenHeight = screenHeightPx
 
         val edge =
             when {
@@ -785,11 +945,9 @@ class FloatingBubbleService : Service() {
      * @param bubble The bubble to snap
      */
     private fun snapToEdge(bubble: BubbleData) {
-        val displayMetrics = resources.displayMetrics
-        val screenWidth = displayMetrics.widthPixels
-        val screenHeight = displayMetrics.heightPixels
+        val screenWidth = screenWidthPx
+        val screenHeight = screenHeightPx
 
-        val bubbleSizePx = dpToPx(currentBubbleSizeDp)
         val centerX = bubble.params.x + bubbleSizePx / 2
         val centerY = bubble.params.y + bubbleSizePx / 2
 
@@ -807,7 +965,7 @@ class FloatingBubbleService : Service() {
         try {
             windowManager.updateViewLayout(bubble.view, bubble.params)
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to snap bubble to edge", e)
         }
     }
 
@@ -818,9 +976,8 @@ class FloatingBubbleService : Service() {
         if (highlightedAreaView != null) return
 
         try {
-            val displayMetrics = resources.displayMetrics
-            val screenWidth = displayMetrics.widthPixels
-            val screenHeight = displayMetrics.heightPixels
+            val screenWidth = screenWidthPx
+            val screenHeight = screenHeightPx
 
             // Create highlighted area view
             highlightedAreaView = HighlightedAreaView(this, currentThemeName)
@@ -878,10 +1035,10 @@ class FloatingBubbleService : Service() {
                     highlightedAreaView?.show()
                 }
             } catch (e: Exception) {
-                e.printStackTrace()
+                logWarning("Failed to add highlighted areas", e)
             }
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to show highlighted areas", e)
         }
     }
 
@@ -897,13 +1054,13 @@ class FloatingBubbleService : Service() {
                     try {
                         windowManager.removeView(view)
                     } catch (e: Exception) {
-                        e.printStackTrace()
+                        logWarning("Failed to remove highlighted areas", e)
                     }
                 }, 200)
             }
             highlightedAreaView = null
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to hide highlighted areas", e)
         }
     }
 
@@ -943,11 +1100,11 @@ class FloatingBubbleService : Service() {
                     }
 
                     // Show feedback
-                    Toast.makeText(this, "Content updated", Toast.LENGTH_SHORT).show()
+                    showToast("Content updated")
                 }
             }
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to apply drop action", e)
         }
     }
 
@@ -967,14 +1124,14 @@ class FloatingBubbleService : Service() {
                 val clipText = clipData.getItemAt(0).text?.toString()
                 if (!clipText.isNullOrEmpty()) {
                     // Show smart action feedback
-                    Toast.makeText(this, smartAction.label, Toast.LENGTH_SHORT).show()
+                    showToast(smartAction.label)
 
                     // Handle specific smart actions (triggers external apps based on ActionType)
                     handleSpecificSmartAction(smartAction, clipText)
                 }
             }
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to apply smart action", e)
         }
     }
 
@@ -995,7 +1152,7 @@ class FloatingBubbleService : Service() {
                     intent.addFlags(Intent.FLAG_ACTIVITY_NEW_TASK)
                     startActivity(intent)
                 } catch (e: Exception) {
-                    Toast.makeText(this, "Could not open link", Toast.LENGTH_SHORT).show()
+                    showToast("Could not open link")
                 }
             }
             SmartAction.ActionType.CALL_NUMBER -> {
@@ -1005,7 +1162,7 @@ class FloatingBubbleService : Service() {
                     intent.addFlags(Intent.FLAG_ACTIVITY_NEW_TASK)
                     startActivity(intent)
                 } catch (e: Exception) {
-                    Toast.makeText(this, "Could not dial number", Toast.LENGTH_SHORT).show()
+                    showToast("Could not dial number")
                 }
             }
             SmartAction.ActionType.SEND_EMAIL -> {
@@ -1015,7 +1172,7 @@ class FloatingBubbleService : Service() {
                     intent.addFlags(Intent.FLAG_ACTIVITY_NEW_TASK)
                     startActivity(intent)
                 } catch (e: Exception) {
-                    Toast.makeText(this, "Could not open email", Toast.LENGTH_SHORT).show()
+                    showToast("Could not open email")
                 }
             }
             SmartAction.ActionType.OPEN_MAPS -> {
@@ -1025,7 +1182,7 @@ class FloatingBubbleService : Service() {
                     intent.addFlags(Intent.FLAG_ACTIVITY_NEW_TASK)
                     startActivity(intent)
                 } catch (e: Exception) {
-                    Toast.makeText(this, "Could not open maps", Toast.LENGTH_SHORT).show()
+                    showToast("Could not open maps")
                 }
             }
             SmartAction.ActionType.SEARCH_WEB -> {
@@ -1035,12 +1192,12 @@ class FloatingBubbleService : Service() {
                     intent.addFlags(Intent.FLAG_ACTIVITY_NEW_TASK)
                     startActivity(intent)
                 } catch (e: Exception) {
-                    Toast.makeText(this, "Could not search", Toast.LENGTH_SHORT).show()
+                    showToast("Could not search")
                 }
             }
             else -> {
                 // Other action types not yet implemented
-                Toast.makeText(this, "Action not implemented: ${smartAction.label}", Toast.LENGTH_SHORT).show()
+                showToast("Action not implemented: ${smartAction.label}")
             }
         }
     }
@@ -1050,6 +1207,14 @@ class FloatingBubbleService : Service() {
      */
     private fun handleEmptyBubbleClick() {
         try {
+            if (!ClipboardUtils.hasTextClip(clipboardManager)) return
+
+            // Refuse up front so a paste at the cap doesn't tear down the empty bubble for nothing
+            if (bubbles.size >= MAX_BUBBLE_COUNT) {
+                showToast(BUBBLE_LIMIT_MESSAGE)
+                return
+            }
+
             val clipData = clipboardManager.primaryClip
             if (clipData != null && clipData.itemCount > 0) {
                 val clipText = clipData.getItemAt(0).text?.toString() ?: ""
@@ -1059,13 +1224,18 @@ class FloatingBubbleService : Service() {
                         val result = addClipboardItemUseCase(clipText)
                         if (result != null) {
                             // Content was added, create bubble with synchronization
-                            withContext(Dispatchers.Main) {
+                            withContext(Dispatchers.Main.immediate) {
                                 synchronized(bubbleLock) {
+                                    // Bubbles loaded while the item was being saved may have filled the slots
+                                    if (bubbles.size >= MAX_BUBBLE_COUNT) {
+                                        showToast(BUBBLE_LIMIT_MESSAGE)
+                                        return@synchronized
+                                    }
                                     emptyBubble?.let { bubble ->
                                         try {
                                             windowManager.removeView(bubble.view)
                                         } catch (e: Exception) {
-                                            e.printStackTrace()
+                                            logWarning("Failed to remove empty bubble", e)
                                         }
                                         emptyBubble = null
                                         createFullBubble(clipText, bubbles.size)
@@ -1075,19 +1245,15 @@ class FloatingBubbleService : Service() {
                             }
                         } else {
                             // Content already exists, show message
-                            withContext(Dispatchers.Main) {
-                                Toast.makeText(
-                                    this@FloatingBubbleService,
-                                    "Content already exists in clipboard history",
-                                    Toast.LENGTH_SHORT,
-                                ).show()
+                            withContext(Dispatchers.Main.immediate) {
+                                showToast("Content already exists in clipboard history")
                             }
                         }
                     }
                 }
             }
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to handle empty bubble click", e)
         }
     }
 
@@ -1122,13 +1288,13 @@ class FloatingBubbleService : Service() {
             // Fallback to traditional clipboard method
             handleTraditionalClipboardPaste(content, currentTime)
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to paste bubble content; falling back to copy", e)
             // Ultimate fallback
             try {
                 clipboardManager.setPrimaryClip(ClipData.newPlainText("clipboard", content))
-                Toast.makeText(this, "Content copied to clipboard", Toast.LENGTH_SHORT).show()
+                showToast("Content copied to clipboard")
             } catch (fallbackException: Exception) {
-                fallbackException.printStackTrace()
+                logWarning("Fallback copy to clipboard failed", fallbackException)
             }
         }
     }
@@ -1141,17 +1307,23 @@ class FloatingBubbleService : Service() {
             // Check if we're in the append window
             if (appendWindowActive && (currentTime - lastCopyTime) <= APPEND_WINDOW_MS) {
                 // Append mode: append bubble content to current clipboard
-                val currentClip = clipboardManager.primaryClip?.getItemAt(0)?.text?.toString() ?: ""
-                val newContent = if (currentClip.isBlank()) content else "$currentClip\n$content"
+                val currentClip = clipboardManager.primaryClip?.getItemAt(0)?.text
+                appendBuffer.setLength(0)
+                if (!currentClip.isNullOrBlank()) appendBuffer.append(currentClip).append('\n')
+                appendBuffer.append(content)
+                val newContent = appendBuffer.toString()
+                // Don't keep the text alive, nor the capacity grown by one unusually large clip
+                appendBuffer.setLength(0)
+                if (appendBuffer.capacity() > APPEND_BUFFER_CAPACITY) appendBuffer.trimToSize()
                 clipboardManager.setPrimaryClip(ClipData.newPlainText("clipboard", newContent))
-                Toast.makeText(this, "Content appended to clipboard", Toast.LENGTH_SHORT).show()
+                showToast("Content appended to clipboard")
 
                 // End append window
                 appendWindowActive = false
             } else {
                 // Normal mode: replace clipboard with bubble content
                 clipboardManager.setPrimaryClip(ClipData.newPlainText("clipboard", content))
-                Toast.makeText(this, "Content copied to clipboard", Toast.LENGTH_SHORT).show()
+                showToast("Content copied to clipboard")
 
                 // Start 2-second append window
                 lastCopyTime = currentTime
@@ -1164,7 +1336,7 @@ class FloatingBubbleService : Service() {
                 }
             }
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to copy bubble content", e)
         }
     }
 
@@ -1180,7 +1352,7 @@ class FloatingBubbleService : Service() {
                         // Unregister from transparency controller
                         TransparencyController.unregisterBubble(it.transparencyCallback)
                     } catch (e: Exception) {
-                        e.printStackTrace()
+                        logWarning("Failed to remove empty bubble", e)
                     }
                 }
                 bubbles.forEach {
@@ -1189,14 +1361,14 @@ class FloatingBubbleService : Service() {
                         // Unregister from transparency controller
                         TransparencyController.unregisterBubble(it.transparencyCallback)
                     } catch (e: Exception) {
-                        e.printStackTrace()
+                        logWarning("Failed to remove bubble", e)
                     }
                 }
 
                 emptyBubble = null
                 bubbles.clear()
             } catch (e: Exception) {
-                e.printStackTrace()
+                logWarning("Failed to remove bubbles", e)
             }
         }
     }
@@ -1208,23 +1380,58 @@ class FloatingBubbleService : Service() {
         synchronized(bubbleLock) {
             try {
                 // Keep only the most recent bubbles based on low memory limit
-                val bubblesToRemove = bubbles.drop(MAX_LOW_MEMORY_BUBBLES)
+                if (bubbles.size <= MAX_LOW_MEMORY_BUBBLES) return
+                val bubblesToRemove = bubbles.subList(MAX_LOW_MEMORY_BUBBLES, bubbles.size)
                 bubblesToRemove.forEach { bubble ->
                     try {
                         windowManager.removeView(bubble.view)
                         // Unregister from transparency controller
                         TransparencyController.unregisterBubble(bubble.transparencyCallback)
                     } catch (e: Exception) {
-                        e.printStackTrace()
+                        logWarning("Failed to remove excess bubble", e)
                     }
                 }
-                bubbles.removeAll(bubblesToRemove.toSet())
+                bubblesToRemove.clear()
             } catch (e: Exception) {
-                e.printStackTrace()
+                logWarning("Failed to remove excess bubbles", e)
             }
         }
     }
 
+    /**
+     * Recomputes the cached bubble and screen sizes in pixels.
+     */
+    private fun updateDisplayMetrics() {
+        val displayMetrics = resources.displayMetrics
+        bubbleSizePx = dpToPx(currentBubbleSizeDp)
+        bubbleMarginPx = dpToPx(BUBBLE_MARGIN_DP)
+        screenWidthPx = displayMetrics.widthPixels
+        screenHeightPx = displayMetrics.heightPixels
+    }
+
+    /**
+     * Shows short feedback text, replacing any feedback toast still on screen.
+     *
+     * @param text The text to show
+     */
+    private fun showToast(text: CharSequence) {
+        feedbackToast.setText(text)
+        feedbackToast.show()
+    }
+
+    /**
+     * Logs a recoverable failure in debug builds; release builds skip building the stack trace.
+     *
+     * @param message What the service was doing
+     * @param e The caught exception
+     */
+    private fun logWarning(
+        message: String,
+        e: Exception,
+    ) {
+        if (BuildConfig.DEBUG) Log.w(TAG, message, e)
+    }
+
     /**
      * Converts dp to pixels.
      *
@@ -1273,20 +1480,11 @@ class FloatingBubbleService : Service() {
      * @return The notification
      */
     private fun createNotification(): Notification {
-        val intent = Intent(this, MainActivity::class.java)
-        val pendingIntent =
-            PendingIntent.getActivity(
-                this,
-                0,
-                intent,
-                PendingIntent.FLAG_UPDATE_CURRENT or PendingIntent.FLAG_IMMUTABLE,
-            )
-
         return NotificationCompat.Builder(this, CHANNEL_ID)
             .setContentTitle("Floating Bubbles")
             .setContentText("Clipboard bubbles active")
             .setSmallIcon(R.drawable.ic_notification)
-            .setContentIntent(pendingIntent)
+            .setContentIntent(contentPendingIntent)
             .setOngoing(true)
             .setCategory(NotificationCompat.CATEGORY_SERVICE)
             .setVisibility(NotificationCompat.VISIBILITY_PUBLIC)
@@ -1306,7 +1504,7 @@ class FloatingBubbleService : Service() {
                     try {
                         windowManager.updateViewLayout(bubble.view, bubble.params)
                     } catch (e: Exception) {
-                        e.printStackTrace()
+                        logWarning("Failed to update empty bubble opacity", e)
                     }
                 }
 
@@ -1315,12 +1513,12 @@ class FloatingBubbleService : Service() {
                     try {
                         windowManager.updateViewLayout(bubble.view, bubble.params)
                     } catch (e: Exception) {
-                        e.printStackTrace()
+                        logWarning("Failed to update bubble opacity", e)
                     }
                 }
             }
         } catch (e: Exception) {
-            e.printStackTrace()
+            logWarning("Failed to update bubble opacity", e)
         }
     }
 }
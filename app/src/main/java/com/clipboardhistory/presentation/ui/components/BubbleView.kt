@@ -36,6 +36,15 @@ class BubbleView(
 ) : View(context) {
     private val paint = Paint(Paint.ANTI_ALIAS_FLAG)
     private val textPaint = Paint(Paint.ANTI_ALIAS_FLAG)
+
+    // Reused across onDraw calls; face colors only change with the bubble color
+    private val topFacePaint = Paint(Paint.ANTI_ALIAS_FLAG)
+    private val rightFacePaint = Paint(Paint.ANTI_ALIAS_FLAG)
+    private val previewPaint =
+        Paint(Paint.ANTI_ALIAS_FLAG).apply {
+            color = Color.WHITE
+            textAlign = Paint.Align.CENTER
+        }
     private val rect = RectF()
     private val path = Path()
 
@@ -67,6 +76,9 @@ class BubbleView(
         // Calculate text color based on background brightness
         val brightness = calculateBrightness(bubbleColor)
         textColor = if (brightness > 0.5f) Color.BLACK else Color.WHITE
+
+        topFacePaint.color = lightenColor(bubbleColor, 0.2f)
+        rightFacePaint.color = darkenColor(bubbleColor, 0.2f)
     }
 
     /**
@@ -134,6 +146,18 @@ class BubbleView(
         }
     }
 
+    /**
+     * Updates the bubble opacity.
+     *
+     * @param newOpacity The new bubble opacity
+     */
+    fun updateOpacity(newOpacity: Float) {
+        if (opacity != newOpacity) {
+            opacity = newOpacity
+            invalidate()
+        }
+    }
+
     /**
      * Flashes the bubble content for a short duration.
      * Only works for cube bubbles.
@@ -261,26 +285,22 @@ class BubbleView(
         canvas.drawRoundRect(rect, 8f, 8f, paint)
 
         // Draw top face (lighter)
-        val topPaint = Paint(paint)
-        topPaint.color = lightenColor(bubbleColor, 0.2f)
         rect.set(
             centerX - halfSize + 4,
             centerY - halfSize - 4,
             centerX + halfSize + 4,
             centerY + halfSize - 4,
         )
-        canvas.drawRoundRect(rect, 8f, 8f, topPaint)
+        canvas.drawRoundRect(rect, 8f, 8f, topFacePaint)
 
         // Draw right face (darker)
-        val rightPaint = Paint(paint)
-        rightPaint.color = darkenColor(bubbleColor, 0.2f)
         rect.set(
             centerX + halfSize,
             centerY - halfSize + 4,
             centerX + halfSize + 4,
             centerY + halfSize + 4,
         )
-        canvas.drawRoundRect(rect, 8f, 8f, rightPaint)
+        canvas.drawRoundRect(rect, 8f, 8f, rightFacePaint)
     }
 
     /**
@@ -396,10 +416,7 @@ class BubbleView(
         centerY: Float,
         size: Float,
     ) {
-        val previewPaint = Paint(Paint.ANTI_ALIAS_FLAG)
-        previewPaint.color = Color.WHITE
         previewPaint.textSize = size * 0.15f
-        previewPaint.textAlign = Paint.Align.CENTER
         previewPaint.alpha = (flashAlpha * 255).toInt()
 
         val previewText = content?.take(MAX_CONTENT_PREVIEW_CHARS) ?: ""
@@ -447,8 +464,17 @@ object BubbleViewFactory {
         content: String? = null,
         opacity: Float = 1.0f,
     ): BubbleView {
-        val theme = BubbleThemes.ALL_THEMES.find { it.name == themeName } ?: BubbleThemes.DEFAULT
-        return BubbleView(context, theme, state, bubbleType, content, opacity)
+        return BubbleView(context, getTheme(themeName), state, bubbleType, content, opacity)
+    }
+
+    /**
+     * Gets the theme with the given name.
+     *
+     * @param themeName The theme name
+     * @return The matching theme, or the default theme if none matches
+     */
+    fun getTheme(themeName: String): BubbleTheme {
+        return BubbleThemes.ALL_THEMES.find { it.name == themeName } ?: BubbleThemes.DEFAULT
     }
 
     /**
@@ -462,7 +488,7 @@ object BubbleViewFactory {
         themeName: String,
         state: BubbleState,
     ): Int {
-        val theme = BubbleThemes.ALL_THEMES.find { it.name == themeName } ?: BubbleThemes.DEFAULT
+        val theme = getTheme(themeName)
         return when (state) {
             BubbleState.EMPTY -> theme.colors.empty
             BubbleState.STORING -> theme.colors.storing
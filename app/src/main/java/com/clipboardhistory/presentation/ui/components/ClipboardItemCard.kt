@@ -1,31 +1,34 @@
 package com.clipboardhistory.presentation.ui.components
 
+import androidx.compose.foundation.background
 import androidx.compose.foundation.layout.Arrangement
 import androidx.compose.foundation.layout.Column
 import androidx.compose.foundation.layout.Row
-import androidx.compose.foundation.layout.Spacer
 import androidx.compose.foundation.layout.fillMaxWidth
-import androidx.compose.foundation.layout.height
 import androidx.compose.foundation.layout.padding
 import androidx.compose.foundation.layout.size
 import androidx.compose.foundation.shape.RoundedCornerShape
 import androidx.compose.material.icons.Icons
 import androidx.compose.material.icons.filled.ContentCopy
 import androidx.compose.material.icons.filled.Delete
-import androidx.compose.material3.Card
-import androidx.compose.material3.CardDefaults
 import androidx.compose.material3.Icon
 import androidx.compose.material3.IconButton
+import androidx.compose.material3.LocalContentColor
 import androidx.compose.material3.MaterialTheme
 import androidx.compose.material3.Text
 import androidx.compose.runtime.Composable
+import androidx.compose.runtime.CompositionLocalProvider
+import androidx.compose.runtime.remember
 import androidx.compose.ui.Alignment
 import androidx.compose.ui.Modifier
+import androidx.compose.ui.draw.alpha
+import androidx.compose.ui.draw.shadow
+import androidx.compose.ui.semantics.clearAndSetSemantics
 import androidx.compose.ui.text.style.TextOverflow
 import androidx.compose.ui.unit.dp
 import com.clipboardhistory.domain.model.ClipboardItem
 import java.text.SimpleDateFormat
-import java.util.*
+import java.util.Locale
 
 /**
  * Clipboard item card composable.
@@ -36,6 +39,7 @@ import java.util.*
  * @param onCopyClick Callback when copy button is clicked
  * @param onDeleteClick Callback when delete button is clicked
  * @param modifier Modifier for the card
+ * @param minuteTick Current wall-clock minute; a new value refreshes the relative timestamp
  */
 @Composable
 fun ClipboardItemCard(
@@ -43,99 +47,132 @@ fun ClipboardItemCard(
     onCopyClick: (ClipboardItem) -> Unit,
     onDeleteClick: (ClipboardItem) -> Unit,
     modifier: Modifier = Modifier,
+    minuteTick: Long = System.currentTimeMillis() / 60_000,
 ) {
-    Card(
-        modifier = modifier,
-        shape = RoundedCornerShape(12.dp),
-        elevation = CardDefaults.cardElevation(defaultElevation = 4.dp),
-    ) {
+    val colorScheme = MaterialTheme.colorScheme
+    val typography = MaterialTheme.typography
+
+    // Derived strings only change with their inputs; the timestamp is re-keyed on each minute tick
+    val timeText =
+        remember(item.timestamp, minuteTick) {
+            formatTimestamp(item.timestamp)
+        }
+    val footerText =
+        remember(item.contentType, item.size) {
+            buildString(32) {
+                append(item.contentType.name)
+                append(" • ")
+                appendSize(item.size)
+            }
+        }
+    val linesText = remember(item.content) { "${item.content.count { it == '\n' } + 1} lines" }
+    val onCopy = remember(item, onCopyClick) { { onCopyClick(item) } }
+    val onDelete = remember(item, onDeleteClick) { { onDeleteClick(item) } }
+
+    // Shadow + background instead of a Material Card: same look, one less layout node per item
+    val containerColor = colorScheme.surfaceContainerHighest
+    val cardBackground =
+        remember(containerColor) {
+            Modifier
+                .shadow(4.dp, CardShape)
+                .background(containerColor, CardShape)
+        }
+
+    CompositionLocalProvider(LocalContentColor provides colorScheme.onSurface) {
         Column(
             modifier =
-                Modifier
-                    .fillMaxWidth()
-                    .padding(16.dp),
+                modifier
+                    .then(cardBackground)
+                    .then(ContentPadding),
+            verticalArrangement = Arrangement.spacedBy(8.dp),
         ) {
-            // Header with timestamp and actions
+            // Header with timestamp and actions; the weighted timestamp pushes the buttons to the end
             Row(
-                modifier = Modifier.fillMaxWidth(),
-                horizontalArrangement = Arrangement.SpaceBetween,
+                modifier = FullWidth,
                 verticalAlignment = Alignment.CenterVertically,
             ) {
                 Text(
-                    text = formatTimestamp(item.timestamp),
-                    style = MaterialTheme.typography.bodySmall,
-                    color = MaterialTheme.colorScheme.onSurfaceVariant,
+                    text = timeText,
+                    modifier = Modifier.weight(1f),
+                    style = typography.bodySmall,
+                    color = colorScheme.onSurfaceVariant,
                 )
 
-                Row {
-                    IconButton(
-                        onClick = { onCopyClick(item) },
-                        modifier = Modifier.size(32.dp),
-                    ) {
-                        Icon(
-                            imageVector = Icons.Default.ContentCopy,
-                            contentDescription = "Copy",
-                            modifier = Modifier.size(16.dp),
-                        )
-                    }
-
-                    IconButton(
-                        onClick = { onDeleteClick(item) },
-                        modifier = Modifier.size(32.dp),
-                    ) {
-                        Icon(
-                            imageVector = Icons.Default.Delete,
-                            contentDescription = "Delete",
-                            modifier = Modifier.size(16.dp),
-                            tint = MaterialTheme.colorScheme.error,
-                        )
-                    }
+                IconButton(
+                    onClick = onCopy,
+                    modifier = IconButtonSize,
+                ) {
+                    Icon(
+                        imageVector = CopyIcon,
+                        contentDescription = "Copy",
+                        modifier = IconSize,
+                    )
                 }
-            }
 
-            Spacer(modifier = Modifier.height(8.dp))
+                IconButton(
+                    onClick = onDelete,
+                    modifier = IconButtonSize,
+                ) {
+                    Icon(
+                        imageVector = DeleteIcon,
+                        contentDescription = "Delete",
+                        modifier = IconSize,
+                        tint = colorScheme.error,
+                    )
+                }
+            }
 
             // Content
             Text(
                 text = item.content,
-                style = MaterialTheme.typography.bodyMedium,
+                style = typography.bodyMedium,
                 maxLines = 3,
                 overflow = TextOverflow.Ellipsis,
             )
 
-            Spacer(modifier = Modifier.height(8.dp))
-
             // Footer with metadata
             Row(
-                modifier = Modifier.fillMaxWidth(),
+                modifier = FullWidth,
                 horizontalArrangement = Arrangement.SpaceBetween,
                 verticalAlignment = Alignment.CenterVertically,
             ) {
                 Column {
                     Text(
-                        text = "${item.contentType.name} • ${formatSize(item.size)}",
-                        style = MaterialTheme.typography.bodySmall,
-                        color = MaterialTheme.colorScheme.onSurfaceVariant,
+                        text = footerText,
+                        style = typography.bodySmall,
+                        color = colorScheme.onSurfaceVariant,
                     )
                     Text(
-                        text = "${item.content.count { it == '\n' } + 1} lines",
-                        style = MaterialTheme.typography.bodySmall,
-                        color = MaterialTheme.colorScheme.onSurfaceVariant,
+                        text = linesText,
+                        style = typography.bodySmall,
+                        color = colorScheme.onSurfaceVariant,
                     )
                 }
 
-                if (item.isEncrypted) {
-                    Text(
-                        text = "🔒 Encrypted",
-                        style = MaterialTheme.typography.bodySmall,
-                        color = MaterialTheme.colorScheme.primary,
-                    )
-                }
+                // Always composed so the Row keeps the same children; only its draw alpha changes
+                Text(
+                    text = ENCRYPTED_LABEL,
+                    modifier = if (item.isEncrypted) Modifier else HiddenLabel,
+                    style = typography.bodySmall,
+                    color = colorScheme.primary,
+                )
             }
         }
     }
 }
 
+private val CardShape = RoundedCornerShape(12.dp)
+private val CopyIcon = Icons.Default.ContentCopy
+private val DeleteIcon = Icons.Default.Delete
+
+private val FullWidth = Modifier.fillMaxWidth()
+private val ContentPadding = Modifier.fillMaxWidth().padding(16.dp)
+private val IconButtonSize = Modifier.size(32.dp)
+private val IconSize = Modifier.size(16.dp)
+private val HiddenLabel = Modifier.alpha(0f).clearAndSetSemantics {}
+
+private const val ENCRYPTED_LABEL = "🔒 Encrypted"
+
 /**
  * Formats a timestamp to a human-readable string.
  *
@@ -143,30 +180,56 @@ fun ClipboardItemCard(
  * @return Formatted timestamp string
  */
 private fun formatTimestamp(timestamp: Long): String {
-    val now = System.currentTimeMillis()
-    val diff = now - timestamp
+    val diff = System.currentTimeMillis() - timestamp
 
-    return when {
-        diff < 60_000 -> "Just now"
-        diff < 3600_000 -> "${diff / 60_000}m ago"
-        diff < 86400_000 -> "${diff / 3600_000}h ago"
-        else -> {
-            val formatter = SimpleDateFormat("MMM dd, HH:mm", Locale.getDefault())
-            formatter.format(Date(timestamp))
+    if (diff < RELATIVE_TIME_LIMITS[0]) return "Just now"
+    for (i in 1 until RELATIVE_TIME_LIMITS.size) {
+        if (diff < RELATIVE_TIME_LIMITS[i]) {
+            return StringBuilder(8)
+                .append(diff / RELATIVE_TIME_DIVISORS[i])
+                .append(RELATIVE_TIME_SUFFIXES[i])
+                .toString()
         }
     }
+    return timestampFormatter(Locale.getDefault()).format(timestamp)
+}
+
+/**
+ * Relative-time buckets for [formatTimestamp]: exclusive upper bound, divisor and suffix per bucket.
+ * Bucket 0 is rendered as "Just now".
+ */
+private val RELATIVE_TIME_LIMITS = longArrayOf(60_000L, 3_600_000L, 86_400_000L)
+private val RELATIVE_TIME_DIVISORS = longArrayOf(1L, 60_000L, 3_600_000L)
+private val RELATIVE_TIME_SUFFIXES = arrayOf("", "m ago", "h ago")
+
+/**
+ * Per-thread date formatter for [formatTimestamp] and the locale it was built for;
+ * SimpleDateFormat is costly to build and not thread-safe.
+ */
+private val cachedTimestampFormatter = ThreadLocal<Pair<Locale, SimpleDateFormat>>()
+
+/**
+ * Gets this thread's date formatter, rebuilding it when the locale differs from the cached one.
+ *
+ * @param locale The locale to format for
+ * @return A formatter for [locale], owned by the calling thread
+ */
+private fun timestampFormatter(locale: Locale): SimpleDateFormat {
+    val cached = cachedTimestampFormatter.get()
+    if (cached != null && cached.first == locale) return cached.second
+    return SimpleDateFormat("MMM dd, HH:mm", locale).also { cachedTimestampFormatter.set(locale to it) }
 }
 
 /**
- * Formats a size in bytes to a human-readable string.
+ * Appends a size in bytes as a human-readable string, without building an intermediate String.
  *
  * @param size The size in bytes
- * @return Formatted size string
+ * @return This builder
  */
-private fun formatSize(size: Int): String {
+private fun StringBuilder.appendSize(size: Int): StringBuilder {
     return when {
-        size < 1024 -> "${size}B"
-        size < 1024 * 1024 -> "${size / 1024}KB"
-        else -> "${size / (1024 * 1024)}MB"
+        size < 1024 -> append(size).append('B')
+        size < 1 shl 20 -> append(size shr 10).append("KB")
+        else -> append(size shr 20).append("MB")
     }
 }
@@ -26,7 +26,9 @@ import androidx.compose.material3.Switch
 import androidx.compose.material3.Text
 import androidx.compose.material3.TextButton
 import androidx.compose.runtime.Composable
+import androidx.compose.runtime.MutableIntState
 import androidx.compose.runtime.getValue
+import androidx.compose.runtime.mutableIntStateOf
 import androidx.compose.runtime.mutableStateOf
 import androidx.compose.runtime.remember
 import androidx.compose.runtime.setValue
@@ -39,6 +41,7 @@ import androidx.compose.ui.unit.dp
 import com.clipboardhistory.domain.model.BubbleThemes
 import com.clipboardhistory.domain.model.BubbleType
 import com.clipboardhistory.domain.model.ClipboardSettings
+import kotlin.math.roundToInt
 
 /**
  * Settings dialog composable.
@@ -55,11 +58,15 @@ fun SettingsDialog(
     onDismiss: () -> Unit,
     onSave: (ClipboardSettings) -> Unit,
 ) {
-    var maxHistorySize by remember { mutableStateOf(settings.maxHistorySize) }
-    var autoDeleteHours by remember { mutableStateOf(settings.autoDeleteAfterHours) }
+    val typography = MaterialTheme.typography
+
+    // Slider states are passed down unread so dragging one slider only recomposes its own row
+    val maxHistorySize = remember { mutableIntStateOf(settings.maxHistorySize) }
+    val autoDeleteHours = remember { mutableIntStateOf(settings.autoDeleteAfterHours) }
     var enableEncryption by remember { mutableStateOf(settings.enableEncryption) }
-    var bubbleSize by remember { mutableStateOf(settings.bubbleSize) }
-    var bubbleOpacity by remember { mutableStateOf(settings.bubbleOpacity) }
+    val bubbleSize = remember { mutableIntStateOf(settings.bubbleSize) }
+    // Opacity is edited in tenths (1..10) to match the slider steps
+    val bubbleOpacityTenths = remember { mutableIntStateOf((settings.bubbleOpacity * 10).roundToInt()) }
     var selectedTheme by remember { mutableStateOf(settings.selectedTheme) }
     var selectedBubbleType by remember { mutableStateOf(settings.bubbleType) }
 
@@ -68,7 +75,7 @@ fun SettingsDialog(
         title = {
             Text(
                 text = "Settings",
-                style = MaterialTheme.typography.headlineSmall,
+                style = typography.headlineSmall,
                 fontWeight = FontWeight.Bold,
             )
         },
@@ -77,51 +84,16 @@ fun SettingsDialog(
                 modifier = Modifier.fillMaxWidth(),
                 verticalArrangement = Arrangement.spacedBy(16.dp),
             ) {
-                // Max history size setting
-                SettingsSlider(
-                    label = "Max History Size",
-                    value = maxHistorySize,
-                    onValueChange = { maxHistorySize = it },
-                    valueRange = 10f..500f,
-                    steps = 48,
-                    valueFormatter = { "${it.toInt()} items" },
-                )
-
-                // Auto-delete hours setting
-                SettingsSlider(
-                    label = "Auto-delete After",
-                    value = autoDeleteHours,
-                    onValueChange = { autoDeleteHours = it },
-                    valueRange = 1f..168f,
-                    steps = 166,
-                    valueFormatter = { "${it.toInt()} hours" },
-                )
-
-                // Bubble size setting
-                SettingsSlider(
-                    label = "Bubble Size",
-                    value = bubbleSize,
-                    onValueChange = { bubbleSize = it },
-                    valueRange = 1f..5f,
-                    steps = 3,
-                    valueFormatter = { "Size ${it.toInt()}" },
-                )
-
-                // Bubble opacity setting
-                SettingsSlider(
-                    label = "Bubble Opacity",
-                    value = (bubbleOpacity * 10).toInt(),
-                    onValueChange = { bubbleOpacity = it / 10f },
-                    valueRange = 1f..10f,
-                    steps = 8,
-                    valueFormatter = { "${(it * 10).toInt()}%" },
-                )
+                MaxHistorySizeRow(maxHistorySize)
+                AutoDeleteHoursRow(autoDeleteHours)
+                BubbleSizeRow(bubbleSize)
+                BubbleOpacityRow(bubbleOpacityTenths)
 
                 // Theme selection
                 Column {
                     Text(
                         text = "Bubble Theme",
-                        style = MaterialTheme.typography.bodyLarge,
+                        style = typography.bodyLarge,
                     )
                     Spacer(modifier = Modifier.height(8.dp))
                     LazyRow(
@@ -145,7 +117,7 @@ fun SettingsDialog(
                 ) {
                     Text(
                         text = "Enable Encryption",
-                        style = MaterialTheme.typography.bodyLarge,
+                        style = typography.bodyLarge,
                     )
                     Switch(
                         checked = enableEncryption,
@@ -157,7 +129,7 @@ fun SettingsDialog(
                 Column {
                     Text(
                         text = "Bubble Type",
-                        style = MaterialTheme.typography.bodyLarge,
+                        style = typography.bodyLarge,
                     )
                     Spacer(modifier = Modifier.height(8.dp))
                     LazyRow(
@@ -178,12 +150,12 @@ fun SettingsDialog(
             TextButton(
                 onClick = {
                     val newSettings =
-                        ClipboardSettings(
-                            maxHistorySize = maxHistorySize,
-                            autoDeleteAfterHours = autoDeleteHours,
+                        settings.copy(
+                            maxHistorySize = maxHistorySize.intValue,
+                            autoDeleteAfterHours = autoDeleteHours.intValue,
                             enableEncryption = enableEncryption,
-                            bubbleSize = bubbleSize,
-                            bubbleOpacity = bubbleOpacity,
+                            bubbleSize = bubbleSize.intValue,
+                            bubbleOpacity = bubbleOpacityTenths.intValue / 10f,
                             selectedTheme = selectedTheme,
                             bubbleType = selectedBubbleType,
                         )
@@ -201,6 +173,54 @@ fun SettingsDialog(
     )
 }
 
+@Composable
+private fun MaxHistorySizeRow(state: MutableIntState) {
+    SettingsSlider(
+        label = "Max History Size",
+        value = state.intValue,
+        onValueChange = { state.intValue = it },
+        valueRange = 10f..500f,
+        steps = 48,
+        valueFormatter = { "$it items" },
+    )
+}
+
+@Composable
+private fun AutoDeleteHoursRow(state: MutableIntState) {
+    SettingsSlider(
+        label = "Auto-delete After",
+        value = state.intValue,
+        onValueChange = { state.intValue = it },
+        valueRange = 1f..168f,
+        steps = 166,
+        valueFormatter = { "$it hours" },
+    )
+}
+
+@Composable
+private fun BubbleSizeRow(state: MutableIntState) {
+    SettingsSlider(
+        label = "Bubble Size",
+        value = state.intValue,
+        onValueChange = { state.intValue = it },
+        valueRange = 1f..5f,
+        steps = 3,
+        valueFormatter = { "Size $it" },
+    )
+}
+
+@Composable
+private fun BubbleOpacityRow(state: MutableIntState) {
+    SettingsSlider(
+        label = "Bubble Opacity",
+        value = state.intValue,
+        onValueChange = { state.intValue = it },
+        valueRange = 1f..10f,
+        steps = 8,
+        valueFormatter = { "${it * 10}%" },
+    )
+}
+
 /**
  * Bubble type chip composable for bubble type selection.
  *
@@ -214,13 +234,16 @@ fun BubbleTypeChip(
     isSelected: Boolean,
     onClick: () -> Unit,
 ) {
+    val colorScheme = MaterialTheme.colorScheme
+    val typography = MaterialTheme.typography
+
     Card(
         modifier =
             Modifier
                 .clickable { onClick() }
                 .border(
                     width = if (isSelected) 2.dp else 1.dp,
-                    color = if (isSelected) MaterialTheme.colorScheme.primary else MaterialTheme.colorScheme.outline,
+                    color = if (isSelected) colorScheme.primary else colorScheme.outline,
                     shape = RoundedCornerShape(16.dp),
                 ),
         shape = RoundedCornerShape(16.dp),
@@ -228,9 +251,9 @@ fun BubbleTypeChip(
             CardDefaults.cardColors(
                 containerColor =
                     if (isSelected) {
-                        MaterialTheme.colorScheme.primaryContainer
+                        colorScheme.primaryContainer
                     } else {
-                        MaterialTheme.colorScheme.surface
+                        colorScheme.surface
                     },
             ),
     ) {
@@ -244,7 +267,7 @@ fun BubbleTypeChip(
                     Modifier
                         .size(32.dp)
                         .background(
-                            color = MaterialTheme.colorScheme.primary.copy(alpha = 0.2f),
+                            color = colorScheme.primary.copy(alpha = 0.2f),
                             shape =
                                 when (bubbleType) {
                                     BubbleType.CIRCLE -> CircleShape
@@ -263,8 +286,8 @@ fun BubbleTypeChip(
                             BubbleType.HEXAGON -> "⬡"
                             BubbleType.SQUARE -> "□"
                         },
-                    style = MaterialTheme.typography.bodyMedium,
-                    color = MaterialTheme.colorScheme.primary,
+                    style = typography.bodyMedium,
+                    color = colorScheme.primary,
                 )
             }
 
@@ -272,12 +295,12 @@ fun BubbleTypeChip(
 
             Text(
                 text = bubbleType.name.lowercase().replaceFirstChar { it.uppercase() },
-                style = MaterialTheme.typography.bodySmall,
+                style = typography.bodySmall,
                 color =
                     if (isSelected) {
-                        MaterialTheme.colorScheme.onPrimaryContainer
+                        colorScheme.onPrimaryContainer
                     } else {
-                        MaterialTheme.colorScheme.onSurface
+                        colorScheme.onSurface
                     },
             )
         }
@@ -297,6 +320,8 @@ fun ThemeChip(
     isSelected: Boolean,
     onClick: () -> Unit,
 ) {
+    val colorScheme = MaterialTheme.colorScheme
+    val typography = MaterialTheme.typography
     val colors = theme.colors
 
     Card(
@@ -305,7 +330,7 @@ fun ThemeChip(
                 .clickable { onClick() }
                 .border(
                     width = if (isSelected) 2.dp else 1.dp,
-                    color = if (isSelected) MaterialTheme.colorScheme.primary else MaterialTheme.colorScheme.outline,
+                    color = if (isSelected) colorScheme.primary else colorScheme.outline,
                     shape = RoundedCornerShape(16.dp),
                 ),
         shape = RoundedCornerShape(16.dp),
@@ -352,7 +377,7 @@ fun ThemeChip(
 
             Text(
                 text = theme.name,
-                style = MaterialTheme.typography.bodySmall,
+                style = typography.bodySmall,
                 fontWeight = if (isSelected) FontWeight.Bold else FontWeight.Normal,
             )
         }
@@ -376,8 +401,13 @@ fun SettingsSlider(
     onValueChange: (Int) -> Unit,
     valueRange: ClosedFloatingPointRange<Float>,
     steps: Int,
-    valueFormatter: (Float) -> String,
+    valueFormatter: (Int) -> String,
 ) {
+    val colorScheme = MaterialTheme.colorScheme
+    val typography = MaterialTheme.typography
+
+    val displayText = remember(value, valueFormatter) { valueFormatter(value) }
+
     Column {
         Row(
             modifier = Modifier.fillMaxWidth(),
@@ -386,18 +416,22 @@ fun SettingsSlider(
         ) {
             Text(
                 text = label,
-                style = MaterialTheme.typography.bodyLarge,
+                style = typography.bodyLarge,
             )
             Text(
-                text = valueFormatter(value.toFloat()),
-                style = MaterialTheme.typography.bodyMedium,
-                color = MaterialTheme.colorScheme.onSurfaceVariant,
+                text = displayText,
+                style = typography.bodyMedium,
+                color = colorScheme.onSurfaceVariant,
             )
         }
 
         Slider(
             value = value.toFloat(),
-            onValueChange = { onValueChange(it.toInt()) },
+            // Only whole steps reach the caller; sub-step drag movement is dropped here
+            onValueChange = {
+                val stepped = it.roundToInt()
+                if (stepped != value) onValueChange(stepped)
+            },
             valueRange = valueRange,
             steps = steps,
         )
@@ -48,6 +48,7 @@ import androidx.compose.ui.platform.LocalContext
 import androidx.compose.ui.text.AnnotatedString
 import androidx.compose.ui.text.font.FontWeight
 import androidx.compose.ui.unit.dp
+import com.clipboardhistory.domain.model.ClipboardItem
 import com.clipboardhistory.presentation.ui.components.ClipboardItemCard
 import com.clipboardhistory.presentation.ui.components.SettingsDialog
 import com.clipboardhistory.presentation.viewmodels.MainViewModel
@@ -75,12 +76,20 @@ fun MainScreen(
     onStopServices: () -> Unit,
 ) {
     val uiState by viewModel.uiState.collectAsState()
+    val minuteTick by viewModel.minuteTick.collectAsState()
     val clipboardManager = LocalClipboardManager.current
     val context = LocalContext.current
 
     var showSettings by remember { mutableStateOf(false) }
     var showAddDialog by remember { mutableStateOf(false) }
 
+    // Hoisted so every ClipboardItemCard receives the same callback instances across recompositions
+    val onCopyItem: (ClipboardItem) -> Unit =
+        remember(clipboardManager) {
+            { clipboardItem -> clipboardManager.setText(AnnotatedString(clipboardItem.content)) }
+        }
+    val onDeleteItem: (ClipboardItem) -> Unit = remember(viewModel) { viewModel::deleteClipboardItem }
+
     // Handle errors
     LaunchedEffect(uiState.error) {
         uiState.error?.let { error ->
@@ -169,15 +178,16 @@ fun MainScreen(
                     contentPadding = PaddingValues(16.dp),
                     verticalArrangement = Arrangement.spacedBy(8.dp),
                 ) {
-                    items(uiState.clipboardItems) { item ->
+                    items(
+                        items = uiState.clipboardItems,
+                        key = { it.id },
+                        contentType = { it.contentType },
+                    ) { item ->
                         ClipboardItemCard(
                             item = item,
-                            onCopyClick = { clipboardItem ->
-                                clipboardManager.setText(AnnotatedString(clipboardItem.content))
-                            },
-                            onDeleteClick = { clipboardItem ->
-                                viewModel.deleteClipboardItem(clipboardItem)
-                            },
+                            onCopyClick = onCopyItem,
+                            onDeleteClick = onDeleteItem,
+                            minuteTick = minuteTick,
                         )
                     }
                 }
@@ -3,6 +3,7 @@ package com.clipboardhistory.presentation.viewmodels
 import android.app.ActivityManager
 import android.app.Application
 import android.content.Context
+import androidx.compose.runtime.Immutable
 import androidx.lifecycle.AndroidViewModel
 import androidx.lifecycle.viewModelScope
 import com.clipboardhistory.domain.model.ClipboardItem
@@ -15,9 +16,13 @@ import com.clipboardhistory.domain.usecase.GetClipboardSettingsUseCase
 import com.clipboardhistory.domain.usecase.UpdateClipboardSettingsUseCase
 import com.clipboardhistory.presentation.services.ClipboardService
 import dagger.hilt.android.lifecycle.HiltViewModel
+import kotlinx.coroutines.delay
 import kotlinx.coroutines.flow.MutableStateFlow
+import kotlinx.coroutines.flow.SharingStarted
 import kotlinx.coroutines.flow.StateFlow
 import kotlinx.coroutines.flow.asStateFlow
+import kotlinx.coroutines.flow.flow
+import kotlinx.coroutines.flow.stateIn
 import kotlinx.coroutines.launch
 import javax.inject.Inject
 
@@ -42,6 +47,22 @@ class MainViewModel
         private val _uiState = MutableStateFlow(MainUiState())
         val uiState: StateFlow<MainUiState> = _uiState.asStateFlow()
 
+        /**
+         * Current wall-clock minute, shared by every visible card to refresh relative timestamps.
+         * Only ticks while the list is collecting it.
+         */
+        val minuteTick: StateFlow<Long> =
+            flow {
+                while (true) {
+                    emit(System.currentTimeMillis() / MINUTE_MILLIS)
+                    delay(MINUTE_MILLIS)
+                }
+            }.stateIn(
+                viewModelScope,
+                SharingStarted.WhileSubscribed(5_000),
+                System.currentTimeMillis() / MINUTE_MILLIS,
+            )
+
         /**
          * Data class representing the UI state for the main screen.
          *
@@ -51,6 +72,7 @@ class MainViewModel
          * @property error Error message if any
          * @property isServiceRunning Whether the clipboard service is running
          */
+        @Immutable
         data class MainUiState(
             val clipboardItems: List<ClipboardItem> = emptyList(),
             val settings: ClipboardSettings = ClipboardSettings(),
@@ -186,4 +208,8 @@ class MainViewModel
                 }
             }
         }
+
+        private companion object {
+            const val MINUTE_MILLIS = 60_000L
+        }
     }
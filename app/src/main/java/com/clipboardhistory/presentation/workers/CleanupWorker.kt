@@ -0,0 +1,63 @@
+package com.clipboardhistory.presentation.workers
+
+import android.content.Context
+import androidx.hilt.work.HiltWorker
+import androidx.work.Constraints
+import androidx.work.CoroutineWorker
+import androidx.work.ExistingPeriodicWorkPolicy
+import androidx.work.PeriodicWorkRequestBuilder
+import androidx.work.WorkManager
+import androidx.work.WorkerParameters
+import com.clipboardhistory.domain.usecase.CleanupOldItemsUseCase
+import com.clipboardhistory.domain.usecase.GetClipboardSettingsUseCase
+import dagger.assisted.Assisted
+import dagger.assisted.AssistedInject
+import java.util.concurrent.TimeUnit
+
+/**
+ * Periodic worker that deletes clipboard items older than the configured age.
+ *
+ * Runs off the clipboard-change path so saving a clip never pays for a cleanup pass.
+ */
+@HiltWorker
+class CleanupWorker
+    @AssistedInject
+    constructor(
+        @Assisted appContext: Context,
+        @Assisted workerParams: WorkerParameters,
+        private val getClipboardSettingsUseCase: GetClipboardSettingsUseCase,
+        private val cleanupOldItemsUseCase: CleanupOldItemsUseCase,
+    ) : CoroutineWorker(appContext, workerParams) {
+        override suspend fun doWork(): Result {
+            return try {
+                cleanupOldItemsUseCase(getClipboardSettingsUseCase())
+                Result.success()
+            } catch (e: Exception) {
+                Result.retry()
+            }
+        }
+
+        companion object {
+            private const val WORK_NAME = "clip_cleanup"
+
+            /**
+             * Schedules the periodic cleanup, keeping any schedule that already exists.
+             *
+             * @param context Any context; the application context is used
+             */
+            fun schedule(context: Context) {
+                val request =
+                    PeriodicWorkRequestBuilder<CleanupWorker>(15, TimeUnit.MINUTES)
+                        .setConstraints(
+                            Constraints.Builder()
+                                .setRequiresBatteryNotLow(true)
+                                .build(),
+                        )
+                        .setInitialDelay(1, TimeUnit.MINUTES)
+                        .build()
+
+                WorkManager.getInstance(context.applicationContext)
+                    .enqueueUniquePeriodicWork(WORK_NAME, ExistingPeriodicWorkPolicy.KEEP, request)
+            }
+        }
+    }
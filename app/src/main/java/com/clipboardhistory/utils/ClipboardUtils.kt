@@ -1,6 +1,7 @@
 package com.clipboardhistory.utils
 
 import android.content.ClipData
+import android.content.ClipDescription
 import android.content.ClipboardManager
 import android.content.Context
 import android.widget.Toast
@@ -46,6 +47,21 @@ object ClipboardUtils {
         }
     }
 
+    /**
+     * Checks from the clip description alone whether the primary clip holds text.
+     *
+     * Unlike [ClipboardManager.getPrimaryClip], this does not transfer the clip's data,
+     * so it is a cheap way to skip images and files before reading the clip.
+     *
+     * @param clipboardManager The clipboard manager
+     * @return True if the primary clip is plain text or HTML, false otherwise
+     */
+    fun hasTextClip(clipboardManager: ClipboardManager): Boolean {
+        val description = clipboardManager.primaryClipDescription ?: return false
+        return description.hasMimeType(ClipDescription.MIMETYPE_TEXT_PLAIN) ||
+            description.hasMimeType(ClipDescription.MIMETYPE_TEXT_HTML)
+    }
+
     /**
      * Checks if the clipboard has text content.
      *
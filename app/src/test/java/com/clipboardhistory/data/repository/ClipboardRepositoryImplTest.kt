@@ -6,8 +6,12 @@ import com.clipboardhistory.data.encryption.EncryptionManager
 import com.clipboardhistory.domain.model.ClipboardItem
 import com.clipboardhistory.domain.model.ClipboardSettings
 import com.clipboardhistory.domain.model.ContentType
+import kotlinx.coroutines.ExperimentalCoroutinesApi
 import kotlinx.coroutines.flow.first
 import kotlinx.coroutines.flow.flowOf
+import kotlinx.coroutines.flow.toList
+import kotlinx.coroutines.launch
+import kotlinx.coroutines.test.UnconfinedTestDispatcher
 import kotlinx.coroutines.test.runTest
 import org.junit.Before
 import org.junit.Rule
@@ -15,6 +19,7 @@ import org.junit.Test
 import org.mockito.Mock
 import org.mockito.junit.MockitoJUnit
 import org.mockito.junit.MockitoRule
+import org.mockito.kotlin.any
 import org.mockito.kotlin.argumentCaptor
 import org.mockito.kotlin.verify
 import org.mockito.kotlin.whenever
@@ -125,6 +130,24 @@ class ClipboardRepositoryImplTest {
             verify(encryptionManager).storeSecureString("clipboard_mode", "EXTEND")
         }
 
+    @OptIn(ExperimentalCoroutinesApi::class)
+    @Test
+    fun `observeSettings emits stored settings then updates`() =
+        runTest {
+            whenever(encryptionManager.getSecureString(any(), any())).thenAnswer { it.getArgument<String>(1) }
+            val updated = ClipboardSettings(bubbleSize = 5, bubbleOpacity = 0.5f)
+
+            val emissions = mutableListOf<ClipboardSettings>()
+            val collector =
+                launch(UnconfinedTestDispatcher(testScheduler)) {
+                    repository.observeSettings().toList(emissions)
+                }
+            repository.updateSettings(updated)
+            collector.cancel()
+
+            assertEquals(listOf(ClipboardSettings(), updated), emissions)
+        }
+
     @Test
     fun `deleteItemsOlderThan calls dao with correct timestamp`() =
         runTest {
@@ -138,25 +161,33 @@ class ClipboardRepositoryImplTest {
             assertTrue(kotlin.math.abs(tsCaptor.firstValue - expectedThreshold) < 2000)
         }
 
-    private fun createTestEntity(content: String): ClipboardItemEntity {
-        return ClipboardItemEntity(
-            id = "test-id",
-            content = content,
-            timestamp = System.currentTimeMillis(),
-            contentType = ContentType.TEXT,
-            isEncrypted = true,
-            size = content.length,
-        )
-    }
-
-    private fun createTestItem(content: String): ClipboardItem {
-        return ClipboardItem(
-            id = "test-id",
-            content = content,
-            timestamp = System.currentTimeMillis(),
-            contentType = ContentType.TEXT,
-            isEncrypted = true,
-            size = content.length,
-        )
+    private fun createTestEntity(content: String): ClipboardItemEntity =
+        templateEntity.copy(content = content, size = content.length)
+
+    private fun createTestItem(content: String): ClipboardItem =
+        templateItem.copy(content = content, size = content.length)
+
+    private companion object {
+        const val TEST_TIMESTAMP = 1_700_000_000_000L
+
+        val templateEntity =
+            ClipboardItemEntity(
+                id = "test-id",
+                content = "",
+                timestamp = TEST_TIMESTAMP,
+                contentType = ContentType.TEXT,
+                isEncrypted = true,
+                size = 0,
+            )
+
+        val templateItem =
+            ClipboardItem(
+                id = "test-id",
+                content = "",
+                timestamp = TEST_TIMESTAMP,
+                contentType = ContentType.TEXT,
+                isEncrypted = true,
+                size = 0,
+            )
     }
 }
@@ -122,6 +122,25 @@ class ClipboardUseCasesTest {
             assertEquals(items, result)
         }
 
+    @Test
+    fun `GetAllClipboardItemsUseCase with limit queries only that many items`() =
+        runTest {
+            // Given
+            val items =
+                listOf(
+                    createTestClipboardItem("Content 1"),
+                    createTestClipboardItem("Content 2"),
+                )
+            whenever(repository.getItemsWithPagination(2, 0)).thenReturn(items)
+
+            // When
+            val result = getAllClipboardItemsUseCase(limit = 2)
+
+            // Then
+            assertEquals(items, result)
+            verify(repository).getItemsWithPagination(2, 0)
+        }
+
     @Test
     fun `DeleteClipboardItemUseCase deletes item`() =
         runTest {
@@ -0,0 +1,37 @@
+package com.clipboardhistory.presentation.services
+
+import org.junit.Test
+import kotlin.test.assertFalse
+import kotlin.test.assertTrue
+
+/**
+ * Unit tests for ClipboardService's image extension check.
+ */
+class ClipboardServiceTest {
+    @Test
+    fun `file names with image extensions are images`() {
+        assertTrue(ClipboardService.hasImageExtension("photo.jpg"))
+        assertTrue(ClipboardService.hasImageExtension("/sdcard/DCIM/IMG_0001.JPEG"))
+        assertTrue(ClipboardService.hasImageExtension("icon.WebP"))
+    }
+
+    @Test
+    fun `other extensions are not images`() {
+        assertFalse(ClipboardService.hasImageExtension("notes.txt"))
+        assertFalse(ClipboardService.hasImageExtension("archive.png.zip"))
+        assertFalse(ClipboardService.hasImageExtension("png"))
+    }
+
+    @Test
+    fun `single-line names containing spaces are images`() {
+        assertTrue(ClipboardService.hasImageExtension("Screenshot 2024-01-01 at 10.00.00.png"))
+        assertTrue(ClipboardService.hasImageExtension("/sdcard/My Pictures/a.png"))
+    }
+
+    @Test
+    fun `multi-line text ending in an image extension is not an image`() {
+        assertFalse(ClipboardService.hasImageExtension("Attached the screenshot\nscreen.png"))
+        assertFalse(ClipboardService.hasImageExtension("first line\r\nlogo.gif"))
+        assertFalse(ClipboardService.hasImageExtension("first line\u2028logo.gif"))
+    }
+}
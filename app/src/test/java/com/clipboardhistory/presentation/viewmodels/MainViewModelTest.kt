@@ -70,7 +70,7 @@ class MainViewModelTest {
 
     @Test
     fun `initial state is correct`() =
-        runTest {
+        runTest(mainDispatcherRule.testDispatcher.scheduler) {
             whenever(getClipboardSettingsUseCase()).thenReturn(ClipboardSettings())
             viewModel =
                 MainViewModel(
@@ -92,7 +92,7 @@ class MainViewModelTest {
 
     @Test
     fun `addClipboardItem calls use case correctly`() =
-        runTest {
+        runTest(mainDispatcherRule.testDispatcher.scheduler) {
             whenever(getClipboardSettingsUseCase()).thenReturn(ClipboardSettings())
             viewModel =
                 MainViewModel(
@@ -112,7 +112,7 @@ class MainViewModelTest {
 
     @Test
     fun `deleteClipboardItem calls use case correctly`() =
-        runTest {
+        runTest(mainDispatcherRule.testDispatcher.scheduler) {
             whenever(getClipboardSettingsUseCase()).thenReturn(ClipboardSettings())
             viewModel =
                 MainViewModel(
@@ -132,7 +132,7 @@ class MainViewModelTest {
 
     @Test
     fun `updateSettings calls use case and updates state`() =
-        runTest {
+        runTest(mainDispatcherRule.testDispatcher.scheduler) {
             whenever(getClipboardSettingsUseCase()).thenReturn(ClipboardSettings())
             viewModel =
                 MainViewModel(
@@ -155,8 +155,8 @@ class MainViewModelTest {
         }
 
     @Test
-    fun `updateServiceRunningState updates state correctly`() =
-        runTest {
+    fun `updateServiceRunningState sets state to running`() =
+        runTest(mainDispatcherRule.testDispatcher.scheduler) {
             whenever(getClipboardSettingsUseCase()).thenReturn(ClipboardSettings())
             viewModel =
                 MainViewModel(
@@ -167,10 +167,26 @@ class MainViewModelTest {
                     updateClipboardSettingsUseCase,
                     cleanupOldItemsUseCase,
                 )
+            viewModel.updateServiceRunningState(false)
             viewModel.updateServiceRunningState(true)
 
             assertTrue(viewModel.uiState.value.isServiceRunning)
+        }
 
+    @Test
+    fun `updateServiceRunningState sets state to stopped`() =
+        runTest(mainDispatcherRule.testDispatcher.scheduler) {
+            whenever(getClipboardSettingsUseCase()).thenReturn(ClipboardSettings())
+            viewModel =
+                MainViewModel(
+                    getAllClipboardItemsUseCase,
+                    addClipboardItemUseCase,
+                    deleteClipboardItemUseCase,
+                    getClipboardSettingsUseCase,
+                    updateClipboardSettingsUseCase,
+                    cleanupOldItemsUseCase,
+                )
+            viewModel.updateServiceRunningState(true)
             viewModel.updateServiceRunningState(false)
 
             assertFalse(viewModel.uiState.value.isServiceRunning)
@@ -178,7 +194,7 @@ class MainViewModelTest {
 
     @Test
     fun `clearError clears error state`() =
-        runTest {
+        runTest(mainDispatcherRule.testDispatcher.scheduler) {
             whenever(getClipboardSettingsUseCase()).thenReturn(ClipboardSettings())
             viewModel =
                 MainViewModel(
@@ -194,14 +210,18 @@ class MainViewModelTest {
             assertNull(viewModel.uiState.value.error)
         }
 
-    private fun createTestClipboardItem(content: String): ClipboardItem {
-        return ClipboardItem(
-            id = "test-id",
-            content = content,
-            timestamp = System.currentTimeMillis(),
-            contentType = ContentType.TEXT,
-            isEncrypted = false,
-            size = content.length,
-        )
+    private fun createTestClipboardItem(content: String): ClipboardItem =
+        templateItem.copy(content = content, size = content.length)
+
+    private companion object {
+        val templateItem =
+            ClipboardItem(
+                id = "test-id",
+                content = "",
+                timestamp = 1_700_000_000_000L,
+                contentType = ContentType.TEXT,
+                isEncrypted = false,
+                size = 0,
+            )
     }
 }
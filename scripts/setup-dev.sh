@@ -16,6 +16,7 @@ NC='\033[0m'
 # Configuration
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_ROOT="$(dirname "$SCRIPT_DIR")"
+LOCAL_PROPERTIES="$PROJECT_ROOT/local.properties"
 ANDROID_SDK_VERSION="9477386"
 ANDROID_COMPILE_SDK="34"
 ANDROID_BUILD_TOOLS="34.0.0"
@@ -43,6 +44,20 @@ print_info() {
     echo -e "${BLUE}ℹ️  $1${NC}"
 }
 
+# Write stdin to a file only if the content differs, so reruns keep mtimes intact.
+# Creates the parent directory as needed.
+write_if_changed() {
+    local target="$1"
+    local tmp
+    mkdir -p "$(dirname "$target")"
+    tmp="$(mktemp)"
+    cat > "$tmp"
+    if [[ ! -f "$target" ]] || ! cmp -s "$tmp" "$target"; then
+        cat "$tmp" > "$target"
+    fi
+    rm -f "$tmp"
+}
+
 # Detect OS
 detect_os() {
     if [[ "$OSTYPE" == "linux-gnu"* ]]; then
@@ -105,13 +120,13 @@ setup_android_sdk() {
     # Check if Android SDK is already configured
     if [[ -n "$ANDROID_HOME" ]] && [[ -d "$ANDROID_HOME" ]]; then
         print_success "Android SDK found at: $ANDROID_HOME"
-        echo "sdk.dir=$ANDROID_HOME" > "$PROJECT_ROOT/local.properties"
+        echo "sdk.dir=$ANDROID_HOME" | write_if_changed "$LOCAL_PROPERTIES"
         return
     fi
     
     if [[ -n "$ANDROID_SDK_ROOT" ]] && [[ -d "$ANDROID_SDK_ROOT" ]]; then
         print_success "Android SDK found at: $ANDROID_SDK_ROOT"
-        echo "sdk.dir=$ANDROID_SDK_ROOT" > "$PROJECT_ROOT/local.properties"
+        echo "sdk.dir=$ANDROID_SDK_ROOT" | write_if_changed "$LOCAL_PROPERTIES"
         export ANDROID_HOME="$ANDROID_SDK_ROOT"
         return
     fi
@@ -162,7 +177,7 @@ setup_android_sdk() {
         "build-tools;${ANDROID_BUILD_TOOLS}"
     
     # Create local.properties
-    echo "sdk.dir=$ANDROID_HOME" > "$PROJECT_ROOT/local.properties"
+    echo "sdk.dir=$ANDROID_HOME" | write_if_changed "$LOCAL_PROPERTIES"
     
     print_success "Android SDK setup completed"
     print_info "Add these lines to your shell profile (~/.bashrc, ~/.zshrc, etc.):"
@@ -198,7 +213,7 @@ setup_git_hooks() {
     local hooks_dir="$PROJECT_ROOT/.git/hooks"
     
     # Pre-commit hook for code quality
-    cat > "$hooks_dir/pre-commit" << 'EOF'
+    write_if_changed "$hooks_dir/pre-commit" << 'EOF'
 #!/bin/bash
 # Pre-commit hook for code quality checks
 
@@ -235,7 +250,7 @@ EOF
     chmod +x "$hooks_dir/pre-commit"
     
     # Pre-push hook for tests
-    cat > "$hooks_dir/pre-push" << 'EOF'
+    write_if_changed "$hooks_dir/pre-push" << 'EOF'
 #!/bin/bash
 # Pre-push hook for running tests
 
@@ -259,11 +274,8 @@ EOF
 setup_ide_config() {
     print_header "⚙️  Setting up IDE Configuration"
     
-    # Create .idea directory structure for IntelliJ/Android Studio
-    mkdir -p "$PROJECT_ROOT/.idea/codeStyles"
-    
-    # Create code style configuration
-    cat > "$PROJECT_ROOT/.idea/codeStyles/Project.xml" << 'EOF'
+    # Create code style configuration for IntelliJ/Android Studio
+    write_if_changed "$PROJECT_ROOT/.idea/codeStyles/Project.xml" << 'EOF'
 <component name="ProjectCodeStyleConfiguration">
   <code_scheme name="Project" version="173">
     <AndroidXmlCodeStyleSettings>
@@ -316,7 +328,7 @@ setup_ide_config() {
 EOF
     
     # Create ktlint configuration
-    cat > "$PROJECT_ROOT/.editorconfig" << 'EOF'
+    write_if_changed "$PROJECT_ROOT/.editorconfig" << 'EOF'
 root = true
 
 [*]
@@ -354,7 +366,7 @@ create_dev_scripts() {
     chmod +x "$PROJECT_ROOT"/scripts/*.sh
     
     # Create quick development commands
-    cat > "$PROJECT_ROOT/dev.sh" << 'EOF'
+    write_if_changed "$PROJECT_ROOT/dev.sh" << 'EOF'
 #!/bin/bash
 # Quick development commands
 
@@ -445,33 +457,41 @@ verify_setup() {
 show_summary() {
     print_header "🎉 Development Environment Setup Complete!"
     
-    echo -e "${GREEN}✅ Setup Summary:${NC}"
-    echo "  📱 Android SDK configured"
-    echo "  📦 Project dependencies downloaded"
-    echo "  🎣 Git hooks installed"
-    echo "  ⚙️  IDE configuration created"
-    echo "  📝 Development scripts ready"
+    # Collect the banner and print it in one write
+    local summary=(
+        "${GREEN}✅ Setup Summary:${NC}"
+        "  📱 Android SDK configured"
+        "  📦 Project dependencies downloaded"
+        "  🎣 Git hooks installed"
+        "  ⚙️  IDE configuration created"
+        "  📝 Development scripts ready"
+    )
     if [[ "$DOCKER_AVAILABLE" == "true" ]]; then
-        echo "  🐳 Docker environment configured"
+        summary+=("  🐳 Docker environment configured")
     fi
     
-    echo -e "\n${BLUE}🚀 Quick Start Commands:${NC}"
-    echo "  ./dev.sh build          # Build debug APK"
-    echo "  ./dev.sh test           # Run tests"
-    echo "  ./dev.sh lint           # Check code quality"
-    echo "  ./dev.sh security       # Run security scans"
-    
-    echo -e "\n${BLUE}📚 Next Steps:${NC}"
-    echo "  1. Open the project in Android Studio"
-    echo "  2. Sync the project"
-    echo "  3. Run './dev.sh build' to test the setup"
-    echo "  4. Start developing! 🎯"
+    summary+=(
+        "\n${BLUE}🚀 Quick Start Commands:${NC}"
+        "  ./dev.sh build          # Build debug APK"
+        "  ./dev.sh test           # Run tests"
+        "  ./dev.sh lint           # Check code quality"
+        "  ./dev.sh security       # Run security scans"
+        "\n${BLUE}📚 Next Steps:${NC}"
+        "  1. Open the project in Android Studio"
+        "  2. Sync the project"
+        "  3. Run './dev.sh build' to test the setup"
+        "  4. Start developing! 🎯"
+    )
     
     if [[ "$OS" != "windows" ]]; then
-        echo -e "\n${YELLOW}💡 Don't forget to add Android SDK to your PATH:${NC}"
-        echo "  export ANDROID_HOME=\"$ANDROID_HOME\""
-        echo "  export PATH=\"\$PATH:\$ANDROID_HOME/cmdline-tools/latest/bin:\$ANDROID_HOME/platform-tools\""
+        summary+=(
+            "\n${YELLOW}💡 Don't forget to add Android SDK to your PATH:${NC}"
+            "  export ANDROID_HOME=\"$ANDROID_HOME\""
+            "  export PATH=\"\$PATH:\$ANDROID_HOME/cmdline-tools/latest/bin:\$ANDROID_HOME/platform-tools\""
+        )
     fi
+    
+    printf '%b\n' "${summary[@]}"
 }
 
 # Main execution